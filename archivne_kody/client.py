@@ -3,16 +3,46 @@ import socket
 import json
 import select
 import struct
-import threading
 import errno
 import time
 import zlib
 from typing import List, Optional, Tuple, Dict
-from queue import Queue
 from card import Card
-import re
+import ipaddress
 import logging
 
+try:
+    from isal import isal_zlib as zlib_impl
+except ImportError:
+    zlib_impl = zlib
+
+try:
+    import zstandard
+    ZstdError = zstandard.ZstdError
+except ImportError:
+    zstandard = None
+    ZstdError = ValueError
+
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    json_loads = orjson.loads  # Accepts memoryview, so raw frames are parsed without a copy
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def json_loads(data):
+        # orjson reads any buffer; the stdlib needs real bytes.
+        return json.loads(bytes(data))
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
@@ -31,43 +61,70 @@ BUTTON_HOVER_COLOR = (150, 150, 150)
 TEXT_COLOR = (255, 255, 255)
 PLACEHOLDER_COLOR = (150, 150, 150)
 LEADERBOARD_DURATION = 10
+TEXT_CACHE_SIZE = 64
+COMPRESS_MIN_SIZE = 256
+RAW_FRAME_FLAG = 0x80000000
+ZSTD_FRAME_FLAG = 0x40000000
+MSGPACK_FRAME_FLAG = 0x20000000
+FRAME_LENGTH_MASK = 0x1FFFFFFF
+# Optional codecs are only used towards a peer that advertised them: the client sends the frame flags it can
+# decode in its "h" hello, the server answers in "w". Plain JSON is what every peer understands.
+LOCAL_CAPS = (MSGPACK_FRAME_FLAG if msgpack else 0) | (ZSTD_FRAME_FLAG if zstandard else 0)
+ZSTD_LEVEL = 3
+FRAME_HEADER = struct.Struct('!I')
+RECV_CHUNK_SIZE = 65536
+_REQ_STATE_KEYS = frozenset({"players", "current_player", "draw_pile", "discard_pile"})
+_REQ_CARD_KEYS = frozenset({"name", "value", "suit"})
+
+def encode_payload(message: dict, caps: int = 0) -> bytes:
+    return msgpack.packb(message) if caps & MSGPACK_FRAME_FLAG else json_dumps(message)
+
+def decode_payload(header: int, payload) -> dict:
+    if header & MSGPACK_FRAME_FLAG:
+        if not msgpack:
+            raise ValueError("msgpack frame received but msgpack is not installed")
+        return msgpack.unpackb(payload, strict_map_key=False)
+    return json_loads(payload)
+
+class CardSprite:
+    __slots__ = ("card", "image", "rect", "angle")
 
-class CardSprite(pygame.sprite.Sprite):
     def __init__(self, card: Card, x: int, y: int, angle: float):
-        super().__init__()
         self.card = card
-        self.image = pygame.transform.rotate(card.image, angle)
+        self.image = card.get_rotated(angle)
         self.rect = self.image.get_rect(topleft=(x, y))
         self.angle = angle
 
 class LayoutManager:
     def __init__(self, screen_width: int, screen_height: int):
-        self.positions = [
-            {"x": screen_width // 2, "y": screen_height - 172, "angle": 0, "offset": 84},
-            {"x": screen_width - 172, "y": screen_height // 2, "angle": -90, "offset": 84},
-            {"x": screen_width // 2, "y": 30, "angle": 180, "offset": 84},
-            {"x": 30, "y": screen_height // 2, "angle": 90, "offset": 84}
-        ]
+        # Hand anchors per seat, stored as parallel tuples indexed by pos_index.
+        self.pos_x = (screen_width // 2, screen_width - 172, screen_width // 2, 30)
+        self.pos_y = (screen_height - 172, screen_height // 2, 30, screen_height // 2)
+        self.pos_angle = (0, -90, 180, 90)
+        self.pos_offset = (84, 84, 84, 84)
+        self.pos_horizontal = (True, False, True, False)
         self.draw_pile_rect = pygame.Rect(screen_width // 2 - 53, screen_height // 2 - 53, CARD_WIDTH + 6, CARD_HEIGHT + 6)
         self.discard_pile_pos = (screen_width // 2 + 50, screen_height // 2 - 50)
-        self.name_positions = [
-            {"x": screen_width // 2, "y": screen_height - 190, "align": "center", "angle": 0},
-            {"x": screen_width - 190, "y": screen_height // 2, "align": "center", "angle": 90},
-            {"x": screen_width // 2, "y": 190, "align": "center", "angle": 180},
-            {"x": 190, "y": screen_height // 2, "align": "center", "angle": -90}
-        ]
-        self.status_positions = [
-            {"x": screen_width // 2, "y": screen_height - 150, "align": "center", "angle": 0},
-            {"x": screen_width - 150, "y": screen_height // 2, "align": "center", "angle": 90},
-            {"x": screen_width // 2, "y": 230, "align": "center", "angle": 180},
-            {"x": 150, "y": screen_height // 2, "align": "center", "angle": -90}
-        ]
-
-    def get_player_position(self, pos_index: int, num_cards: int, card_index: int) -> Tuple[int, int, float]:
-        pos = self.positions[pos_index]
-        x = pos["x"] - (num_cards * pos["offset"] // 2) + (card_index * pos["offset"]) if pos_index in [0, 2] else pos["x"]
-        y = pos["y"] - (num_cards * pos["offset"] // 2) + (card_index * pos["offset"]) if pos_index in [1, 3] else pos["y"]
-        return x, y, pos["angle"]
+        # Text anchors per seat as (x, y, angle), centred on the point.
+        self.name_positions = (
+            (screen_width // 2, screen_height - 190, 0),
+            (screen_width - 190, screen_height // 2, 90),
+            (screen_width // 2, 190, 180),
+            (190, screen_height // 2, -90),
+        )
+        self.status_positions = (
+            (screen_width // 2, screen_height - 150, 0),
+            (screen_width - 150, screen_height // 2, 90),
+            (screen_width // 2, 230, 180),
+            (150, screen_height // 2, -90),
+        )
+
+    def layout_hand(self, pos_index: int, num_cards: int) -> List[Tuple[int, int, float]]:
+        x, y, angle, offset = self.pos_x[pos_index], self.pos_y[pos_index], self.pos_angle[pos_index], self.pos_offset[pos_index]
+        start = -(num_cards * offset // 2)
+        if self.pos_horizontal[pos_index]:
+            return [(x + start + j * offset, y, angle) for j in range(num_cards)]
+        return [(x, y + start + j * offset, angle) for j in range(num_cards)]
 
 class Client:
     def __init__(self):
@@ -80,11 +137,14 @@ class Client:
         self.background = self._load_background("assets/background_green.png")
         self.card_back = self._load_image("assets/default/back.png", (CARD_WIDTH, CARD_HEIGHT))
         self.client_socket = None
-        self.message_queue = Queue()
+        self._reset_stream()
         self.state = "menu"
         self.local_player: Optional[int] = None
         self.game_state: Optional[Dict] = None
-        self.card_sprites: Dict[int, pygame.sprite.Group] = {i: pygame.sprite.Group() for i in range(4)}
+        self.card_sprites: Dict[int, List[CardSprite]] = {i: [] for i in range(4)}
+        self._card_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self._hand_sig: Dict[int, Tuple[int, tuple]] = {}
+        self._hand_bbox: Optional[pygame.Rect] = None
         self.card_rects: List[pygame.Rect] = []
         self.last_click_time: int = 0
         self.waiting_message: Optional[str] = None
@@ -101,24 +161,45 @@ class Client:
         self.leaderboard_start: float = 0
         self.leaderboard_data: Optional[List[Dict]] = None
         self.player_status: Dict[int, str] = {i: "" for i in range(4)}
+        self.prev_dirty: List[pygame.Rect] = []
+        self._last_state_hash: Optional[tuple] = None
+        # Bumped whenever game_state or leaderboard_data is replaced; ids of freed objects get reused.
+        self._state_version: int = 0
+        self._full_redraw: bool = True
+        self._needs_redraw: bool = True
         suits = ["♥", "♦", "♣", "♠"]
         values = list(range(7, 15))
         card_names = [f"{value}{suit}" for suit in suits for value in values] + ["back"]
+        self._txt: Dict[str, pygame.Surface] = {
+            label: self.font.render(label, True, TEXT_COLOR)
+            for label in ("Connect", "Close game", "Leave", "Game Over")
+        }
+        self._txt["Enter IP"] = self.font.render("Enter IP", True, PLACEHOLDER_COLOR)
+        # Player name plates pre-rotated for every seat, keyed by (pid, pos_index, is_current).
+        self._name_plates: Dict[Tuple[int, int, bool], pygame.Surface] = {}
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        for pid in range(4):
+            plain = self.font.render(f"Player {pid + 1}", True, TEXT_COLOR)
+            highlighted = self.font.render(f"Player {pid + 1}", True, HIGHLIGHT_COLOR)
+            for pos_index, (_, _, angle) in enumerate(self.layout.name_positions):
+                self._name_plates[(pid, pos_index, False)] = pygame.transform.rotate(plain, angle)
+                self._name_plates[(pid, pos_index, True)] = pygame.transform.rotate(highlighted, angle)
         Card.preload_images(card_names)
+        self.card_cache["back"] = Card.get("back", 0, "")
 
     def _load_background(self, path: str) -> pygame.Surface:
         try:
             img = pygame.image.load(path)
             if img.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
                 img = pygame.transform.scale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            return img
+            return img.convert()
         except pygame.error as e:
             logger.error(f"Error loading background {path}: {e}")
             return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
 
     def _load_image(self, path: str, size: Tuple[int, int]) -> pygame.Surface:
         try:
-            return pygame.transform.scale(pygame.image.load(path), size)
+            return pygame.transform.scale(pygame.image.load(path), size).convert_alpha()
         except pygame.error as e:
             logger.error(f"Error loading image {path}: {e}")
             return pygame.Surface(size)
@@ -145,6 +226,16 @@ class Client:
             sock.close()
             return None
 
+    def _reset_stream(self) -> None:
+        # One raw-deflate stream and receive buffer per connection; the server keeps the matching pair.
+        self._rx = bytearray(RECV_CHUNK_SIZE)
+        self._rx_len = 0
+        self._zc = zlib_impl.compressobj(1, zlib.DEFLATED, -15)
+        self._zd = zlib_impl.decompressobj(-15)
+        self._zstd_c = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if zstandard else None
+        self._zstd_d = zstandard.ZstdDecompressor() if zstandard else None
+        self.peer_caps = 0  # Frame flags the server said it can decode
+
     def _disconnect(self) -> None:
         if self.client_socket:
             try:
@@ -152,73 +243,103 @@ class Client:
             except socket.error as e:
                 logger.error(f"Error closing socket: {e}")
             self.client_socket = None
+        self._reset_stream()
+        self._needs_redraw = True
         self.state = "menu"
         self.local_player = None
         self.game_state = None
-        self.card_sprites = {i: pygame.sprite.Group() for i in range(4)}
+        self.card_sprites = {i: [] for i in range(4)}
+        self._card_blits = []
+        self._hand_sig = {}
+        self._hand_bbox = None
         self.card_rects = []
         self.waiting_message = None
         self.waiting_start = time.time()
-        self.message_queue = Queue()
         self.leaderboard_start = 0
         self.leaderboard_data = None
         self.player_status = {i: "" for i in range(4)}
 
     def _validate_ip(self, ip: str) -> bool:
-        pattern = r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$'
-        return bool(re.match(pattern, ip))
+        try:
+            ipaddress.IPv4Address(ip)
+            return True
+        except ValueError:
+            return False
 
     def send_message(self, message: dict) -> bool:
         if not self.client_socket:
             return False
         try:
-            data = zlib.compress(json.dumps(message, separators=(',', ':')).encode())
-            self.client_socket.sendall(struct.pack('!I', len(data)) + data)
+            data = encode_payload(message, self.peer_caps)
+            if len(data) < COMPRESS_MIN_SIZE:
+                header = len(data) | RAW_FRAME_FLAG
+            elif self.peer_caps & ZSTD_FRAME_FLAG:
+                data = self._zstd_c.compress(data)
+                header = len(data) | ZSTD_FRAME_FLAG
+            else:
+                data = self._zc.compress(data) + self._zc.flush(zlib.Z_SYNC_FLUSH)
+                header = len(data)
+            self.client_socket.sendall(FRAME_HEADER.pack(header | (self.peer_caps & MSGPACK_FRAME_FLAG)) + data)
             return True
         except socket.error as e:
             logger.error(f"Send error: {e}")
             return False
 
-    def receive_message(self, retries: int = 3, delay: float = 0.1) -> Optional[dict]:
-        buffer = b""
-        for _ in range(retries):
+    def poll_messages(self) -> List[dict]:
+        messages: List[dict] = []
+        if self._rx_len == len(self._rx):
+            # A frame larger than the buffer is still arriving; grow instead of passing recv_into an empty view.
+            self._rx.extend(bytes(len(self._rx)))
+        try:
+            with memoryview(self._rx)[self._rx_len:] as free:
+                received = self.client_socket.recv_into(free)
+        except socket.error as e:
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return messages
+            logger.error(f"Receive error: {e}")
+            return [{"t": "dc"}]
+        if not received:
+            return [{"t": "dc"}]
+        self._rx_len += received
+        pos = 0
+        while self._rx_len - pos >= 4:
+            header = FRAME_HEADER.unpack_from(self._rx, pos)[0]
+            end = pos + 4 + (header & FRAME_LENGTH_MASK)
+            if self._rx_len < end:
+                break
             try:
-                if len(buffer) < 4:
-                    packet = self.client_socket.recv(4)
-                    if not packet:
-                        return None
-                    buffer += packet
-                length = struct.unpack('!I', buffer[:4])[0]
-                while len(buffer) - 4 < length:
-                    packet = self.client_socket.recv(length - (len(buffer) - 4))
-                    if not packet:
-                        return None
-                    buffer += packet
-                data = json.loads(zlib.decompress(buffer[4:]).decode())
-                return data
-            except socket.error as e:
-                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                    time.sleep(delay)
-                    continue
-                logger.error(f"Receive error: {e}")
-                return None
-            except (json.JSONDecodeError, struct.error, zlib.error) as e:
+                with memoryview(self._rx)[pos + 4:end] as frame:
+                    if header & RAW_FRAME_FLAG:
+                        payload = frame
+                    elif header & ZSTD_FRAME_FLAG:
+                        if not self._zstd_d:
+                            raise ValueError("zstd frame received but zstandard is not installed")
+                        payload = self._zstd_d.decompress(frame)
+                    else:
+                        payload = self._zd.decompress(frame)
+                    messages.append(decode_payload(header, payload))
+            except (ValueError, zlib_impl.error, ZstdError) as e:
                 logger.error(f"Decode error: {e}")
-                return None
-        return None
+            pos = end
+        if pos:
+            # Move the unfinished tail to the front; the buffer keeps its capacity.
+            self._rx[:self._rx_len - pos] = self._rx[pos:self._rx_len]
+            self._rx_len -= pos
+        return messages
 
     def validate_game_state(self, state: dict) -> bool:
         try:
-            if not all(k in state for k in ["players", "current_player", "draw_pile", "discard_pile"]):
+            if not state.keys() >= _REQ_STATE_KEYS:
                 return False
-            if not (isinstance(state["players"], list) and len(state["players"]) == 4):
+            players = state["players"]
+            if not (isinstance(players, list) and len(players) == 4):
                 return False
-            for i, hand in enumerate(state["players"]):
+            for i, hand in enumerate(players):
                 if not isinstance(hand, list):
                     logger.error(f"Invalid hand for player {i}")
                     return False
                 for card in hand:
-                    if not all(k in card for k in ["name", "value", "suit"]):
+                    if not card.keys() >= _REQ_CARD_KEYS:
                         logger.error(f"Invalid card in player {i}: {card}")
                         return False
             return 0 <= state["current_player"] < 4
@@ -226,36 +347,92 @@ class Client:
             logger.error(f"Validation error: {e}")
             return False
 
+    def _cache_cards(self, state: dict) -> None:
+        # Build every Card the renderer may need up front so drawing never constructs one.
+        for hand in state["players"]:
+            for card_data in hand:
+                if card_data["name"] not in self.card_cache:
+                    self.card_cache[card_data["name"]] = Card.get(card_data["name"], card_data["value"], card_data["suit"])
+        if state["discard_pile"]:
+            top = state["discard_pile"][-1]
+            if top["name"] not in self.card_cache:
+                self.card_cache[top["name"]] = Card.get(top["name"], top["value"], top["suit"])
+
     def update_card_sprites(self) -> None:
         if not self.game_state or self.local_player is None:
             return
+        changed = False
         for i in range(4):
             hand = self.game_state["players"][i]
-            if not hand:
-                self.card_sprites[i].empty()
-                continue
             pos_index = (i - self.local_player) % 4
-            current_sprites = list(self.card_sprites[i].sprites())
-            if len(current_sprites) != len(hand):
-                self.card_sprites[i].empty()
-                for j, card_data in enumerate(hand):
-                    card_key = card_data["name"]
-                    if card_key not in self.card_cache:
-                        self.card_cache[card_key] = Card(card_data["name"], card_data["value"], card_data["suit"])
-                    card = self.card_cache[card_key]
-                    x, y, angle = self.layout.get_player_position(pos_index, len(hand), j)
-                    sprite = CardSprite(card if i == self.local_player else self.card_cache.get("back", Card("back", 0, "")), x, y, angle)
-                    self.card_sprites[i].add(sprite)
+            sig = (pos_index, tuple(c["name"] for c in hand))
+            old_sig = self._hand_sig.get(i)
+            if old_sig == sig:
+                continue
+            self._hand_sig[i] = sig
+            changed = True
+
+            # Survivors keep their (already rotated) sprite; only the seat change invalidates them.
+            survivors: Dict[str, CardSprite] = {}
+            if old_sig is not None and old_sig[0] == pos_index:
+                survivors = dict(zip(old_sig[1], self.card_sprites[i]))
+
+            ordered = []
+            for card_data, (x, y, angle) in zip(hand, self.layout.layout_hand(pos_index, len(hand))):
+                card_key = card_data["name"]
+                sprite = survivors.pop(card_key, None)
+                if sprite is None:
+                    card = self.card_cache[card_key if i == self.local_player else "back"]
+                    sprite = CardSprite(card, x, y, angle)
+                else:
+                    sprite.rect.topleft = (x, y)
+                ordered.append(sprite)
+            self.card_sprites[i] = ordered
+            if i == self.local_player:
+                self._hand_bbox = ordered[0].rect.unionall([sprite.rect for sprite in ordered[1:]]) if ordered else None
+        if changed:
+            # Every hand flattened into one blit list so a frame draws all cards with a single call.
+            self._card_blits = [(sprite.image, sprite.rect) for i in range(4) for sprite in self.card_sprites[i]]
+
+    def _render_text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # Re-inserting keeps the dict ordered from least to most recently used.
+        self._text_cache[key] = surface
+        return surface
+
+    def _begin_frame(self, state_hash: tuple) -> bool:
+        # Nothing visible changed since the last frame: skip drawing entirely.
+        if state_hash == self._last_state_hash and not self._full_redraw:
+            return False
+        self._last_state_hash = state_hash
+        if self._full_redraw:
+            self.screen.fill(BACKGROUND_COLOR)
+            self.screen.blit(self.background, (0, 0))
+            self.prev_dirty = [self.screen.get_rect()]
+            self._full_redraw = False
+        else:
+            # Everything drawn last frame lies inside prev_dirty, so restoring the
+            # background there leaves a clean canvas for the current elements.
+            for rect in self.prev_dirty:
+                self.screen.blit(self.background, rect, area=rect)
+        return True
 
     def run(self) -> None:
-        threading.Thread(target=self._listen, daemon=True).start()
         clock = pygame.time.Clock()
-        dirty_rects = []
 
         while self.running:
             for event in pygame.event.get():
+                # Any input (including plain mouse motion, which moves hover highlights) may change the frame.
+                self._needs_redraw = True
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._full_redraw = True
                 elif event.type == NETWORK_EVENT:
                     self._handle_network_event(event.message)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -269,21 +446,26 @@ class Client:
                     elif event.unicode.isprintable() and len(self.ip_input) < 15:
                         self.ip_input += event.unicode
 
-            while not self.message_queue.empty():
-                self._handle_network_event(self.message_queue.get())
+            self._drain_socket()
 
             if self.state == "leaderboard" and time.time() - self.leaderboard_start > LEADERBOARD_DURATION:
                 self._disconnect()
 
-            dirty_rects.clear()
+            if not self._needs_redraw:
+                clock.tick(60)
+                continue
+            self._needs_redraw = False
+
             try:
                 if self.state == "menu":
-                    dirty_rects.extend(self._render_menu())
+                    new_dirty = self._render_menu()
                 elif self.state == "leaderboard":
-                    dirty_rects.extend(self._render_leaderboard())
+                    new_dirty = self._render_leaderboard()
                 else:
-                    dirty_rects.extend(self._render())
-                pygame.display.update([rect for rect in dirty_rects if isinstance(rect, pygame.Rect)])
+                    new_dirty = self._render()
+                if new_dirty is not None:
+                    pygame.display.update(self.prev_dirty + new_dirty)
+                    self.prev_dirty = new_dirty
             except Exception as e:
                 logger.error(f"Render loop error: {e}")
                 continue
@@ -291,17 +473,27 @@ class Client:
 
         self._cleanup()
 
-    def _listen(self) -> None:
-        while self.running and self.client_socket:
-            message = self.receive_message()
-            if message:
-                self.message_queue.put(message)
-            time.sleep(0.01)
+    def _drain_socket(self) -> None:
+        # Handle everything already buffered by the kernel without blocking the frame.
+        # The socket is non-blocking, so recv itself reports "nothing yet" and no readiness poll is needed.
+        while self.client_socket:
+            messages = self.poll_messages()
+            if not messages:
+                break
+            for message in messages:
+                self._handle_network_event(message)
+                if not self.client_socket:
+                    break
 
     def _handle_network_event(self, message: dict) -> None:
         self.waiting_start = time.time()
+        self._needs_redraw = True
         msg_type = message.get("t")
-        if msg_type == "dc":
+        if msg_type == "dc" and self.state == "leaderboard":
+            # The server closes every connection right after "go"; keep showing the results.
+            self.client_socket.close()
+            self.client_socket = None
+        elif msg_type == "dc":
             self.waiting_message = "Disconnected from server"
             self.state = "game_over"
             if self.local_player is not None:
@@ -309,6 +501,10 @@ class Client:
             self._disconnect()
         elif msg_type == "w":
             self.local_player = message.get("pid")
+            try:
+                self.peer_caps = int(message.get("caps", 0)) & LOCAL_CAPS
+            except (TypeError, ValueError):
+                self.peer_caps = 0
             self.state = "waiting"
         elif msg_type == "wt":
             self.waiting_message = f"Waiting for {message.get('n', 0)} player(s)..."
@@ -317,14 +513,12 @@ class Client:
             self.waiting_message = message.get("msg", "Waiting for current game to end...")
             self.state = "waiting"
         elif msg_type == "gs":
-            if self.validate_game_state(message):
-                self.game_state = message
-                self.waiting_message = None
-                self.state = "playing"
-                self.update_card_sprites()
+            self._set_game_state(message)
+        elif msg_type == "gd":
+            if self.game_state is None:
+                logger.error("Game state delta received without a baseline")
             else:
-                logger.error("Invalid game state")
-                self.waiting_message = "Invalid game state received"
+                self._set_game_state(self._apply_delta(message.get("ops", [])))
         elif msg_type == "e":
             self.waiting_message = f"Error: {message.get('msg', 'Unknown error')}"
             if message.get("msg") == "Game in progress":
@@ -355,20 +549,50 @@ class Client:
                     })
                     break
             self.leaderboard_start = time.time()
+            self._state_version += 1
             self.game_state = None
-            self.card_sprites = {i: pygame.sprite.Group() for i in range(4)}
+            self.card_sprites = {i: [] for i in range(4)}
+            self._card_blits = []
+            self._hand_sig = {}
+            self._hand_bbox = None
+
+    def _set_game_state(self, state: dict) -> None:
+        if self.validate_game_state(state):
+            self._cache_cards(state)
+            self.game_state = state
+            self._state_version += 1
+            self.waiting_message = None
+            self.state = "playing"
+            self.update_card_sprites()
+        else:
+            logger.error("Invalid game state")
+            self.waiting_message = "Invalid game state received"
+
+    def _apply_delta(self, ops: List[list]) -> dict:
+        # Build a new dict so a delta that fails validation leaves the current state intact.
+        state = dict(self.game_state)
+        state["players"] = list(state["players"])
+        for op in ops:
+            if op[0] == "p":
+                state["players"][op[1]] = op[2]
+            elif op[0] == "a":
+                state[op[1]] = state[op[1]] + op[2]
+            else:
+                state[op[1]] = op[2]
+        return state
 
     def _handle_connect(self) -> None:
         if not self._validate_ip(self.ip_input):
             self.waiting_message = "Invalid IP address"
             return
+        self._reset_stream()
         self.client_socket = self._connect(self.ip_input)
         if not self.client_socket:
             self.waiting_message = f"Failed to connect to {self.ip_input}"
         else:
             self.state = "waiting"
             self.waiting_message = "Connecting..."
-            threading.Thread(target=self._listen, daemon=True).start()
+            self.send_message({"t": "h", "caps": LOCAL_CAPS})
 
     def _handle_click(self, pos: Tuple[int, int]) -> None:
         current_time = pygame.time.get_ticks()
@@ -389,58 +613,62 @@ class Client:
             if self.leave_button_rect.collidepoint(pos):
                 self._disconnect()
             elif self.state == "playing" and self.local_player == self.game_state.get("current_player", -1):
-                for i, sprite in enumerate(self.card_sprites[self.local_player].sprites()):
+                for i, sprite in enumerate(self.card_sprites[self.local_player]):
                     if sprite.rect.collidepoint(pos):
                         self.send_message({"t": "p", "ci": i})
                         return
                 if self.layout.draw_pile_rect.collidepoint(pos):
                     self.send_message({"t": "d"})
 
-    def _render_menu(self) -> List[pygame.Rect]:
+    def _render_menu(self) -> Optional[List[pygame.Rect]]:
+        mouse_pos = pygame.mouse.get_pos()
+        connect_hover = self.connect_button_rect.collidepoint(mouse_pos)
+        close_hover = self.close_button_rect.collidepoint(mouse_pos)
+        if not self._begin_frame(("menu", self.ip_input, self.ip_input_active, connect_hover, close_hover,
+                                  self.waiting_message)):
+            return None
         dirty_rects = []
-        self.screen.fill(BACKGROUND_COLOR)
-        self.screen.blit(self.background, (0, 0))
-        dirty_rects.append(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
         pygame.draw.rect(self.screen, BUTTON_COLOR if not self.ip_input_active else BUTTON_HOVER_COLOR, self.ip_input_rect)
         if self.ip_input:
-            ip_surface = self.font.render(self.ip_input, True, TEXT_COLOR)
+            ip_surface = self._render_text(self.ip_input, TEXT_COLOR)
         else:
-            ip_surface = self.font.render("Enter IP" if not self.ip_input_active else "", True, PLACEHOLDER_COLOR if not self.ip_input_active else TEXT_COLOR)
-        ip_rect = ip_surface.get_rect(center=self.ip_input_rect.center)
-        self.screen.blit(ip_surface, ip_rect)
+            ip_surface = self._txt["Enter IP"] if not self.ip_input_active else None
+        if ip_surface is not None:
+            ip_rect = ip_surface.get_rect(center=self.ip_input_rect.center)
+            self.screen.blit(ip_surface, ip_rect)
         dirty_rects.append(self.ip_input_rect)
 
-        mouse_pos = pygame.mouse.get_pos()
-        connect_color = BUTTON_HOVER_COLOR if self.connect_button_rect.collidepoint(mouse_pos) else BUTTON_COLOR
+        connect_color = BUTTON_HOVER_COLOR if connect_hover else BUTTON_COLOR
         pygame.draw.rect(self.screen, connect_color, self.connect_button_rect)
-        connect_text = self.font.render("Connect", True, TEXT_COLOR)
+        connect_text = self._txt["Connect"]
         connect_text_rect = connect_text.get_rect(center=self.connect_button_rect.center)
         self.screen.blit(connect_text, connect_text_rect)
         dirty_rects.append(self.connect_button_rect)
 
-        close_color = BUTTON_HOVER_COLOR if self.close_button_rect.collidepoint(mouse_pos) else BUTTON_COLOR
+        close_color = BUTTON_HOVER_COLOR if close_hover else BUTTON_COLOR
         pygame.draw.rect(self.screen, close_color, self.close_button_rect)
-        close_text = self.font.render("Close game", True, TEXT_COLOR)
+        close_text = self._txt["Close game"]
         close_text_rect = close_text.get_rect(center=self.close_button_rect.center)
         self.screen.blit(close_text, close_text_rect)
         dirty_rects.append(self.close_button_rect)
 
         if self.waiting_message:
-            text = self.font.render(self.waiting_message, True, TEXT_COLOR)
+            text = self._render_text(self.waiting_message, TEXT_COLOR)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 240))
             self.screen.blit(text, text_rect)
             dirty_rects.append(text_rect)
 
         return dirty_rects
 
-    def _render_leaderboard(self) -> List[pygame.Rect]:
+    def _render_leaderboard(self) -> Optional[List[pygame.Rect]]:
+        mouse_pos = pygame.mouse.get_pos()
+        leave_hover = self.leave_button_rect.collidepoint(mouse_pos)
+        if not self._begin_frame(("leaderboard", self._state_version, leave_hover)):
+            return None
         dirty_rects = []
-        self.screen.fill(BACKGROUND_COLOR)
-        self.screen.blit(self.background, (0, 0))
-        dirty_rects.append(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        title = self.font.render("Game Over", True, TEXT_COLOR)
+        title = self._txt["Game Over"]
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
         self.screen.blit(title, title_rect)
         dirty_rects.append(title_rect)
@@ -449,38 +677,45 @@ class Client:
             for i, entry in enumerate(self.leaderboard_data):
                 player_id = entry.get("pid", 0) + 1
                 text = f"Winner: Player {player_id}"
-                text_surface = self.font.render(text, True, TEXT_COLOR)
+                text_surface = self._render_text(text, TEXT_COLOR)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 + (i + 1) * 50))
                 self.screen.blit(text_surface, text_rect)
                 dirty_rects.append(text_rect)
 
-        mouse_pos = pygame.mouse.get_pos()
-        return_color = BUTTON_HOVER_COLOR if self.leave_button_rect.collidepoint(mouse_pos) else BUTTON_COLOR
+        return_color = BUTTON_HOVER_COLOR if leave_hover else BUTTON_COLOR
         pygame.draw.rect(self.screen, return_color, self.leave_button_rect)
-        return_text = self.font.render("Leave", True, TEXT_COLOR)
+        return_text = self._txt["Leave"]
         return_text_rect = return_text.get_rect(center=self.leave_button_rect.center)
         self.screen.blit(return_text, return_text_rect)
         dirty_rects.append(self.leave_button_rect)
 
         return dirty_rects
 
-    def _render(self) -> List[pygame.Rect]:
+    def _render(self) -> Optional[List[pygame.Rect]]:
         dirty_rects = []
         try:
-            self.screen.fill(BACKGROUND_COLOR)
-            self.screen.blit(self.background, (0, 0))
-            dirty_rects.append(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-
             mouse_pos = pygame.mouse.get_pos()
-            return_color = BUTTON_HOVER_COLOR if self.leave_button_rect.collidepoint(mouse_pos) else BUTTON_COLOR
+            leave_hover = self.leave_button_rect.collidepoint(mouse_pos)
+            hovered_card = -1
+            if self.state == "playing" and self.game_state and self.local_player is not None \
+                    and self.game_state.get("current_player") == self.local_player \
+                    and self._hand_bbox and self._hand_bbox.collidepoint(mouse_pos):
+                hovered_card = next((j for j, sprite in enumerate(self.card_sprites[self.local_player])
+                                     if sprite.rect.collidepoint(mouse_pos)), -1)
+            draw_pile_hover = self.layout.draw_pile_rect.collidepoint(mouse_pos)
+            if not self._begin_frame((self.state, self._state_version, self.waiting_message, leave_hover,
+                                      hovered_card, draw_pile_hover, tuple(self.player_status.values()))):
+                return None
+
+            return_color = BUTTON_HOVER_COLOR if leave_hover else BUTTON_COLOR
             pygame.draw.rect(self.screen, return_color, self.leave_button_rect)
-            return_text = self.font.render("Leave", True, TEXT_COLOR)
+            return_text = self._txt["Leave"]
             return_text_rect = return_text.get_rect(center=self.leave_button_rect.center)
             self.screen.blit(return_text, return_text_rect)
             dirty_rects.append(self.leave_button_rect)
 
             if self.state in ["waiting", "game_over"] and self.waiting_message:
-                text = self.font.render(self.waiting_message, True, TEXT_COLOR)
+                text = self._render_text(self.waiting_message, TEXT_COLOR)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
                 self.screen.blit(text, text_rect)
                 dirty_rects.append(text_rect)
@@ -488,17 +723,15 @@ class Client:
             elif self.state == "playing" and self.game_state and self.local_player is not None:
                 current_player = self.game_state.get("current_player", 0)
 
-                for i in range(4):
-                    if self.card_sprites[i]:
-                        self.card_sprites[i].draw(self.screen)
-                        if i == self.local_player and current_player == self.local_player:
-                            for sprite in self.card_sprites[i]:
-                                if sprite.rect.collidepoint(mouse_pos):
-                                    pygame.draw.rect(self.screen, (0, 0, 0), sprite.rect, CARD_HIGHLIGHT_THICKNESS)
-                                    dirty_rects.append(sprite.rect.inflate(CARD_HIGHLIGHT_THICKNESS * 2, CARD_HIGHLIGHT_THICKNESS * 2))
-                        dirty_rects.extend([sprite.rect for sprite in self.card_sprites[i]])
-
-                if self.layout.draw_pile_rect.collidepoint(mouse_pos):
+                if self._card_blits:
+                    self.screen.blits(self._card_blits, doreturn=False)
+                    dirty_rects.extend([rect for _, rect in self._card_blits])
+                if hovered_card >= 0:
+                    sprite = self.card_sprites[self.local_player][hovered_card]
+                    pygame.draw.rect(self.screen, (0, 0, 0), sprite.rect, CARD_HIGHLIGHT_THICKNESS)
+                    dirty_rects.append(sprite.rect.inflate(CARD_HIGHLIGHT_THICKNESS * 2, CARD_HIGHLIGHT_THICKNESS * 2))
+
+                if draw_pile_hover:
                     pygame.draw.rect(self.screen, (0, 0, 0), self.layout.draw_pile_rect, CARD_HIGHLIGHT_THICKNESS)
                     dirty_rects.append(self.layout.draw_pile_rect.inflate(CARD_HIGHLIGHT_THICKNESS * 2, CARD_HIGHLIGHT_THICKNESS * 2))
                 if self.game_state.get("draw_pile"):
@@ -507,30 +740,22 @@ class Client:
 
                 if self.game_state.get("discard_pile"):
                     card_key = self.game_state["discard_pile"][-1]["name"]
-                    if card_key not in self.card_cache:
-                        self.card_cache[card_key] = Card(
-                            self.game_state["discard_pile"][-1]["name"],
-                            self.game_state["discard_pile"][-1]["value"],
-                            self.game_state["discard_pile"][-1]["suit"]
-                        )
                     self.card_cache[card_key].draw(self.screen, *self.layout.discard_pile_pos)
                     dirty_rects.append(pygame.Rect(self.layout.discard_pile_pos, (CARD_WIDTH, CARD_HEIGHT)))
 
                 for i in range(4):
                     pos_index = (i - self.local_player) % 4
-                    name_pos = self.layout.name_positions[pos_index]
-                    name_color = HIGHLIGHT_COLOR if i == current_player else TEXT_COLOR
-                    name_text = self.font.render(f"Player {i + 1}", True, name_color)
-                    rotated_name = pygame.transform.rotate(name_text, name_pos["angle"])
-                    name_rect = rotated_name.get_rect(center=(name_pos["x"], name_pos["y"]))
+                    name_x, name_y, _ = self.layout.name_positions[pos_index]
+                    rotated_name = self._name_plates[(i, pos_index, i == current_player)]
+                    name_rect = rotated_name.get_rect(center=(name_x, name_y))
                     self.screen.blit(rotated_name, name_rect)
                     dirty_rects.append(name_rect)
 
                     if self.player_status[i]:
-                        status_pos = self.layout.status_positions[pos_index]
-                        status_text = self.font.render(self.player_status[i], True, TEXT_COLOR)
-                        rotated_status = pygame.transform.rotate(status_text, status_pos["angle"])
-                        status_rect = rotated_status.get_rect(center=(status_pos["x"], status_pos["y"]))
+                        status_x, status_y, status_angle = self.layout.status_positions[pos_index]
+                        status_text = self._render_text(self.player_status[i], TEXT_COLOR)
+                        rotated_status = pygame.transform.rotate(status_text, status_angle)
+                        status_rect = rotated_status.get_rect(center=(status_x, status_y))
                         self.screen.blit(rotated_status, status_rect)
                         dirty_rects.append(status_rect)
 
@@ -1,5 +1,6 @@
 import pygame
-from game_logic import Game
+from card import Card
+from game_logic import Game, CARD_NAMES, SUITS
 
 pygame.init()
 
@@ -9,52 +10,81 @@ SCREEN_HEIGHT = 720
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Sedma berie tri")
 
-background_image = pygame.image.load("../assets/backgrounds/background_green.png")
-card_back_image = pygame.image.load("../assets/cards/default/back.png")
+background_image = pygame.image.load("../assets/backgrounds/background_green.png").convert()
+card_back_image = pygame.image.load("../assets/cards/default/back.png").convert_alpha()
 
 HIGHLIGHT_COLOR = (255, 0, 0)
+DRAW_PILE_CLICK_RECT = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50, 80, 142)
+DRAW_PILE_HOVER_RECT = pygame.Rect(SCREEN_WIDTH // 2 - 53, SCREEN_HEIGHT // 2 - 53, 86, 148)
+
+# Per-seat hand layout: (anchor_x, anchor_y, horizontal, angle, rect_w, rect_h).
+LAYOUTS = (
+    (SCREEN_WIDTH // 2, 30, True, 0, 86, 148),                   # Hráč 1 (hore)
+    (SCREEN_WIDTH - 172, SCREEN_HEIGHT // 2, False, -90, 148, 86),  # Hráč 2 (vpravo)
+    (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 172, True, 180, 86, 148),   # Hráč 3 (dole)
+    (30, SCREEN_HEIGHT // 2, False, 90, 148, 86),                # Hráč 4 (vľavo)
+)
 
 game = Game()
 game.create_deck()
 game.deal_cards()
+# The game deals plain card ids; this table supplies the drawable Card for each one.
+CARDS = {card: Card.get(name, card & 0xF, SUITS[card >> 4]) for card, name in CARD_NAMES.items()}
 
 def is_card_clicked(card_rect, mouse_pos):
     return card_rect.collidepoint(mouse_pos)
 
-def draw_player_cards(screen, player_hand, player_index, current_player):
-    num_cards = len(player_hand)
-    for j, card in enumerate(player_hand):
-        if player_index == 0:  # Hráč 1 (hore)
-            x = SCREEN_WIDTH // 2 - (num_cards * 40) + (j * 84)
-            y = 30
-            angle = 0
-        elif player_index == 1:  # Hráč 2 (vpravo)
-            x = SCREEN_WIDTH - 172
-            y = SCREEN_HEIGHT // 2 - (num_cards * 40) + (j * 84)
-            angle = -90
-        elif player_index == 2:  # Hráč 3 (dole)
-            x = SCREEN_WIDTH // 2 - (num_cards * 40) + (j * 84)
-            y = SCREEN_HEIGHT - 172
-            angle = 180
-        elif player_index == 3:  # Hráč 4 (vľavo)
-            x = 30
-            y = SCREEN_HEIGHT // 2 - (num_cards * 40) + (j * 84)
-            angle = 90
-
-        if player_index == 1 or player_index == 3:
-            card_rect = pygame.Rect(x - 3, y - 3, 148, 86)
-        else:
-            card_rect = pygame.Rect(x - 3, y - 3, 86, 148)
-
-        mouse_pos = pygame.mouse.get_pos()
-        if player_index == current_player and card_rect.collidepoint(mouse_pos):
-            pygame.draw.rect(screen, (0, 0, 0), card_rect, 3)
-
-        rotated_card = pygame.transform.rotate(card.image, angle)
-        rotated_rect = rotated_card.get_rect(center=(x + rotated_card.get_width() // 2, y + rotated_card.get_height() // 2))
-
-        screen.blit(rotated_card, rotated_rect.topleft)
-        yield card_rect
+def card_rects(player_hand, player_index):
+    anchor_x, anchor_y, horizontal, _, rect_w, rect_h = LAYOUTS[player_index]
+    start = -(len(player_hand) * 40)
+    if horizontal:
+        return [pygame.Rect(anchor_x + start + j * 84 - 3, anchor_y - 3, rect_w, rect_h) for j in range(len(player_hand))]
+    return [pygame.Rect(anchor_x - 3, anchor_y + start + j * 84 - 3, rect_w, rect_h) for j in range(len(player_hand))]
+
+# Composited hand per seat: (surface, topleft, card rects); rebuilt only when hand_dirty is set.
+hand_surfaces = [None] * len(LAYOUTS)
+hand_dirty = [True] * len(LAYOUTS)
+
+def build_hand_surface(player_hand, player_index):
+    rects = card_rects(player_hand, player_index)
+    if not rects:
+        return None, (0, 0), rects
+    bbox = rects[0].unionall(rects[1:])
+    angle = LAYOUTS[player_index][3]
+    surface = pygame.Surface(bbox.size, pygame.SRCALPHA)
+    surface.blits([(CARDS[card].get_rotated(angle), (r.x - bbox.x + 3, r.y - bbox.y + 3))
+                   for card, r in zip(player_hand, rects)], doreturn=False)
+    return surface, bbox.topleft, rects
+
+def hand_layer(player_hand, player_index):
+    if hand_dirty[player_index]:
+        hand_surfaces[player_index] = build_hand_surface(player_hand, player_index)
+        hand_dirty[player_index] = False
+    return hand_surfaces[player_index]
+
+def render_player_cards(screen, player_hand, player_index):
+    surface, topleft, _ = hand_layer(player_hand, player_index)
+    if surface is not None:
+        screen.blit(surface, topleft)
+
+def hover_rect_at(mouse_pos):
+    if DRAW_PILE_HOVER_RECT.collidepoint(mouse_pos):
+        return DRAW_PILE_HOVER_RECT
+    rects = hand_layer(game.players[game.current_player], game.current_player)[2]
+    i = pygame.Rect(mouse_pos, (1, 1)).collidelist(rects)
+    return rects[i] if i != -1 else None
+
+def draw_scene(screen, hover_rect):
+    screen.blit(background_image, (0, 0))
+    draw_player_indicator(screen, game.current_player)
+    if game.draw_pile:
+        screen.blit(card_back_image, (SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50))
+    if game.discard_pile:
+        CARDS[game.discard_pile[-1]].draw(screen, SCREEN_WIDTH // 2 + 50, SCREEN_HEIGHT // 2 - 50)
+    for i, player_hand in enumerate(game.players):
+        render_player_cards(screen, player_hand, i)
+    if hover_rect:
+        pygame.draw.rect(screen, (0, 0, 0), hover_rect, 3)
 
 
 def draw_player_indicator(screen, player_index):
@@ -84,51 +114,50 @@ def draw_player_indicator(screen, player_index):
         ])
 
 running = True
+# Any game change repaints the whole screen; between turns only the hover outline moves.
+full_redraw = True
+last_hover = None
 while running:
-    screen.blit(background_image, (0, 0))
-
-    draw_player_indicator(screen, game.current_player)
-
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
 
         if event.type == pygame.MOUSEBUTTONDOWN:
+            full_redraw = True
             mouse_pos = event.pos
             current_player = game.players[game.current_player]
 
-            for i, card_rect in enumerate(draw_player_cards(screen, current_player, game.current_player, game.current_player)):
-                if card_rect.collidepoint(mouse_pos):
-                    if not game.play_card(game.current_player, i):
-                        pass
-                    if not current_player:
-                        print(f"Hráč {game.current_player + 1} vypadol z hry!")
-                    break
+            i = pygame.Rect(mouse_pos, (1, 1)).collidelist(card_rects(current_player, game.current_player))
+            if i != -1:
+                if game.play_card(game.current_player, i):
+                    # A seven also deals to the next player, so rebuild every hand.
+                    hand_dirty[:] = [True] * len(hand_dirty)
+                if not current_player:
+                    print(f"Hráč {game.current_player + 1} vypadol z hry!")
 
-            draw_pile_rect = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50, 80, 142)
-            if draw_pile_rect.collidepoint(mouse_pos):
+            if DRAW_PILE_CLICK_RECT.collidepoint(mouse_pos):
                 print("Hráč si vzal kartu z ťahacieho balíka")
-                game.draw_card(game.current_player)
+                if game.draw_card(game.current_player):
+                    hand_dirty[game.current_player] = True
                 game.next_turn()
                 break
 
-    draw_pile_rect = pygame.Rect(SCREEN_WIDTH // 2 - 53, SCREEN_HEIGHT // 2 - 53, 86, 148)
-    mouse_pos = pygame.mouse.get_pos()
-    if draw_pile_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(screen, (0, 0, 0), draw_pile_rect, 3)
-    if game.draw_pile:
-        screen.blit(card_back_image, (SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50))
-
-    if game.discard_pile:
-        game.discard_pile[-1].draw(screen, SCREEN_WIDTH // 2 + 50, SCREEN_HEIGHT // 2 - 50)
-
-    for i, player_hand in enumerate(game.players):
-        list(draw_player_cards(screen, player_hand, i, game.current_player))
+    hover = hover_rect_at(pygame.mouse.get_pos())
+    if full_redraw:
+        draw_scene(screen, hover)
+        pygame.display.flip()
+        full_redraw = False
+    elif hover != last_hover:
+        dirty_rects = [r for r in (last_hover, hover) if r]
+        for r in dirty_rects:
+            screen.set_clip(r)
+            draw_scene(screen, hover)
+        screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+    last_hover = hover
 
     if game.check_game_over():
         print("Hra skončila!")
         running = False
 
-    pygame.display.flip()
-
 pygame.quit()
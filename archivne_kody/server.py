@@ -8,16 +8,84 @@ import time
 import os
 import argparse
 import zlib
-from typing import Dict, List
+import functools
+from typing import Dict, List, Optional
 from game_logic import Game
 import logging
-from datetime import datetime
+
+try:
+    from isal import isal_zlib as zlib_impl
+except ImportError:
+    zlib_impl = zlib
+
+try:
+    import zstandard
+    ZstdError = zstandard.ZstdError
+except ImportError:
+    zstandard = None
+    ZstdError = ValueError
+
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    json_loads = orjson.loads  # Accepts memoryview, so raw frames are parsed without a copy
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def json_loads(data):
+        # orjson reads any buffer; the stdlib needs real bytes.
+        return json.loads(bytes(data))
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import xxhash
+    payload_key = xxhash.xxh3_64_intdigest  # 64-bit int keys keep state_cache lookups cheap
+except ImportError:
+    def payload_key(data: bytes) -> bytes:
+        return data
 
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
 DEFAULT_PORT = 65432
 HOST = '0.0.0.0'
+COMPRESS_MIN_SIZE = 256
+RAW_FRAME_FLAG = 0x80000000
+ZSTD_FRAME_FLAG = 0x40000000
+MSGPACK_FRAME_FLAG = 0x20000000
+FRAME_LENGTH_MASK = 0x1FFFFFFF
+# Optional codecs are only used towards a peer that advertised them: the client sends the frame flags it can
+# decode in its "h" hello, the server answers in "w". Plain JSON is what every peer understands.
+LOCAL_CAPS = (MSGPACK_FRAME_FLAG if msgpack else 0) | (ZSTD_FRAME_FLAG if zstandard else 0)
+ZSTD_LEVEL = 3
+FRAME_HEADER = struct.Struct('!I')
+RECV_CHUNK_SIZE = 65536
+STATE_CACHE_SIZE = 32
+CLOSE_TIMEOUT = 1.0  # Seconds a finished client gets to take its last queued bytes
+
+def encode_payload(message: dict, caps: int = 0) -> bytes:
+    return msgpack.packb(message) if caps & MSGPACK_FRAME_FLAG else json_dumps(message)
+
+def decode_payload(header: int, payload) -> dict:
+    if header & MSGPACK_FRAME_FLAG:
+        if not msgpack:
+            raise ValueError("msgpack frame received but msgpack is not installed")
+        return msgpack.unpackb(payload, strict_map_key=False)
+    return json_loads(payload)
+
+@functools.lru_cache(maxsize=64)
+def static_frame(t: str, key: str, value) -> bytes:
+    """Raw JSON frame for a small fixed message such as {"t": "wt", "n": 3}, encoded once per process."""
+    data = encode_payload({"t": t, key: value})
+    return FRAME_HEADER.pack(len(data) | RAW_FRAME_FLAG) + data
 
 def get_local_ip() -> str:
     try:
@@ -44,61 +112,208 @@ class Server:
         self.server_socket.setblocking(False)
         self.sel.register(self.server_socket, selectors.EVENT_READ, self._accept_client)
         self.clients: Dict[socket.socket, int] = {}
-        self.sockets: List[socket.socket] = []
+        self.client_caps: Dict[socket.socket, int] = {}  # Frame flags each client said it can decode
         self.player_slots: List[bool] = [False, False, False, False]  # Track which slots are occupied
         self.game: Game = None
         self.last_game_state: dict = None
+        self.broadcast_baseline: dict = None  # Last state every client has; deltas are computed against it
         self.player_count: int = 0
-        self.state_cache: Dict[str, bytes] = {}
+        self.state_cache: Dict[object, bytes] = {}  # payload_key(encoded payload) -> shareable frame
+        self.compressors: Dict[socket.socket, object] = {}
+        self.decompressors: Dict[socket.socket, object] = {}
+        self.rx_buffers: Dict[socket.socket, bytearray] = {}
+        self.rx_lengths: Dict[socket.socket, int] = {}  # Bytes of rx_buffers[sock] holding unread data
+        self.tx_buffers: Dict[socket.socket, bytearray] = {}  # Bytes the socket would not take yet
+        self.closing: Dict[socket.socket, tuple] = {}  # Dropped sockets still draining: (deadline, tx)
+        # zstd contexts are stateless per frame, so one pair serves every client.
+        self.zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if zstandard else None
+        self.zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
         self.finish_order: List[int] = []
         signal.signal(signal.SIGINT, self._signal_handler)
         local_ip = get_local_ip()
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server started on {local_ip}:{port} and localhost:{port}")
+        print(f"Server started on {local_ip}:{port} and localhost:{port}")
 
     def _signal_handler(self, sig, frame):
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Shutting down server...")
+        logger.info("Shutting down server...")
         for sock in list(self.clients.keys()):
             sock.close()
         self.server_socket.close()
         self.sel.close()
         sys.exit(0)
 
-    def send_message(self, sock: socket.socket, message: dict, retries: int = 2) -> bool:
-        try:
-            data = zlib.compress(json.dumps(message, separators=(',', ':')).encode())
-            sock.sendall(struct.pack('!I', len(data)) + data)
+    def _compressor(self, sock: socket.socket):
+        zc = self.compressors.get(sock)
+        if zc is None:
+            zc = self.compressors[sock] = zlib_impl.compressobj(1, zlib.DEFLATED, -15)
+        return zc
+
+    def _decompressor(self, sock: socket.socket):
+        zd = self.decompressors.get(sock)
+        if zd is None:
+            zd = self.decompressors[sock] = zlib_impl.decompressobj(-15)
+        return zd
+
+    def _drop_codec(self, sock: socket.socket) -> None:
+        self.compressors.pop(sock, None)
+        self.decompressors.pop(sock, None)
+        self.rx_buffers.pop(sock, None)
+        self.rx_lengths.pop(sock, None)
+        self.tx_buffers.pop(sock, None)
+        self.client_caps.pop(sock, None)
+
+    def _encode_frame(self, data: bytes, sock: socket.socket = None, caps: int = 0) -> bytes:
+        """Frame a payload encoded for ``caps``. Only per-socket deflate frames need ``sock``; the rest are shareable."""
+        payload_flag = caps & MSGPACK_FRAME_FLAG
+        if len(data) >= COMPRESS_MIN_SIZE and not caps & ZSTD_FRAME_FLAG:
+            zc = self._compressor(sock)
+            data = zc.compress(data) + zc.flush(zlib.Z_SYNC_FLUSH)
+            return FRAME_HEADER.pack(len(data) | payload_flag) + data
+        key = payload_key(data)
+        frame = self.state_cache.get(key)
+        if frame is None:
+            if len(data) < COMPRESS_MIN_SIZE:
+                frame = FRAME_HEADER.pack(len(data) | RAW_FRAME_FLAG | payload_flag) + data
+            else:
+                compressed = self.zstd_compressor.compress(data)
+                frame = FRAME_HEADER.pack(len(compressed) | ZSTD_FRAME_FLAG | payload_flag) + compressed
+            if len(self.state_cache) >= STATE_CACHE_SIZE:
+                del self.state_cache[next(iter(self.state_cache))]
+            self.state_cache[key] = frame
+        return frame
+
+    def _send_frame(self, sock: socket.socket, frame: bytes) -> bool:
+        tx = self.tx_buffers.get(sock)
+        if tx:
+            # Keep frames in order behind whatever is still queued.
+            tx += frame
             return True
+        try:
+            sent = sock.send(frame)
+        except BlockingIOError:
+            sent = 0
         except socket.error as e:
             logger.error(f"Send error to player {self.clients.get(sock, 'unknown')}: {e}")
-            if retries > 0:
-                time.sleep(0.1)
-                return self.send_message(sock, message, retries - 1)
             return False
+        if sent < len(frame):
+            self.tx_buffers[sock] = bytearray(frame[sent:])
+            self.sel.modify(sock, selectors.EVENT_READ | selectors.EVENT_WRITE, self._handle_client)
+        return True
+
+    def send_message(self, sock: socket.socket, message: dict) -> bool:
+        caps = self.client_caps.get(sock, 0)
+        return self._send_frame(sock, self._encode_frame(encode_payload(message, caps), sock, caps))
+
+    def _handle_writable(self, sock: socket.socket) -> None:
+        tx = self.tx_buffers.get(sock)
+        if tx:
+            try:
+                sent = sock.send(tx)
+            except BlockingIOError:
+                return
+            except socket.error as e:
+                logger.error(f"Send error to player {self.clients.get(sock, 'unknown')}: {e}")
+                self._remove_client(sock)
+                return
+            del tx[:sent]
+            if tx:
+                return
+        self.tx_buffers.pop(sock, None)
+        self.sel.modify(sock, selectors.EVENT_READ, self._handle_client)
+
+    def _close_after_flush(self, sock: socket.socket) -> None:
+        """Close the socket once anything still queued has gone out, writing the rest as it turns writable."""
+        tx = self.tx_buffers.pop(sock, None)
+        if tx:
+            self.closing[sock] = (time.monotonic() + CLOSE_TIMEOUT, tx)
+            self.sel.modify(sock, selectors.EVENT_WRITE, self._handle_closing)
+            return
+        self._close_socket(sock)
+
+    def _handle_closing(self, sock: socket.socket, mask: int) -> None:
+        tx = self.closing[sock][1]
+        try:
+            del tx[:sock.send(tx)]
+        except BlockingIOError:
+            return
+        except socket.error as e:
+            logger.error(f"Send error while closing: {e}")
+            tx.clear()
+        if not tx:
+            del self.closing[sock]
+            self._close_socket(sock)
+
+    def _close_socket(self, sock: socket.socket) -> None:
+        try:
+            self.sel.unregister(sock)
+            sock.close()
+        except:
+            pass  # Socket might already be closed
 
-    def receive_message(self, sock: socket.socket) -> dict:
+    def _decode_frame(self, sock: socket.socket, header: int, data) -> dict:
+        if header & RAW_FRAME_FLAG:
+            payload = data
+        elif header & ZSTD_FRAME_FLAG:
+            if not self.zstd_decompressor:
+                raise ValueError("zstd frame received but zstandard is not installed")
+            payload = self.zstd_decompressor.decompress(data)
+        else:
+            payload = self._decompressor(sock).decompress(data)
+        return decode_payload(header, payload)
+
+    def receive_messages(self, sock: socket.socket) -> Optional[List[dict]]:
+        """Read what the socket has and return every complete frame; None means the client is gone."""
+        rx = self.rx_buffers.get(sock)
+        if rx is None:
+            rx = self.rx_buffers[sock] = bytearray(RECV_CHUNK_SIZE)
+        rx_len = self.rx_lengths.get(sock, 0)
+        if rx_len == len(rx):
+            # A frame larger than the buffer is still arriving; grow instead of passing recv_into an empty view.
+            rx.extend(bytes(len(rx)))
+        try:
+            with memoryview(rx)[rx_len:] as free:
+                received = sock.recv_into(free)
+        except BlockingIOError:
+            return []
+        except socket.error as e:
+            logger.error(f"Receive error: {e}")
+            return None
+        if not received:
+            return None
+        rx_len += received
+        messages = []
+        pos = 0
         try:
-            length_data = sock.recv(4)
-            if not length_data:
-                return None
-            length = struct.unpack('!I', length_data)[0]
-            data = b""
-            while len(data) < length:
-                packet = sock.recv(length - len(data))
-                if not packet:
-                    return None
-                data += packet
-            message = json.loads(zlib.decompress(data).decode())
-            return message
-        except (socket.error, json.JSONDecodeError, struct.error, zlib.error) as e:
+            while rx_len - pos >= 4:
+                header = FRAME_HEADER.unpack_from(rx, pos)[0]
+                end = pos + 4 + (header & FRAME_LENGTH_MASK)
+                if rx_len < end:
+                    break
+                with memoryview(rx)[pos + 4:end] as frame:
+                    messages.append(self._decode_frame(sock, header, frame))
+                pos = end
+        except (ValueError, zlib_impl.error, ZstdError) as e:
             logger.error(f"Receive error: {e}")
             return None
+        if pos:
+            # Move the unfinished tail to the front; the buffer keeps its capacity.
+            rx[:rx_len - pos] = rx[pos:rx_len]
+            rx_len -= pos
+        self.rx_lengths[sock] = rx_len
+        return messages
 
     def start(self) -> None:
         while True:
-            events = self.sel.select(timeout=0.1)
+            # Game state only changes inside callbacks; the timeout just lets Ctrl+C through on Windows,
+            # where a select() blocked without one never returns to deliver SIGINT.
+            events = self.sel.select(timeout=1.0)
             for key, mask in events:
                 callback = key.data
                 callback(key.fileobj, mask)
+            if self.closing:
+                now = time.monotonic()
+                for sock in [sock for sock, (deadline, _) in self.closing.items() if deadline <= now]:
+                    del self.closing[sock]
+                    self._close_socket(sock)
             if self.game and self.game.check_game_over():
                 self._end_game()
 
@@ -123,44 +338,46 @@ class Server:
                 client_display = f"{addr[0]}:{addr[1]}"
             
             if self.game:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Rejected client from {client_display}: Game in progress")
-                if self.send_message(client_sock, {"t": "e", "msg": "Game in progress"}):
+                logger.info("Rejected client from %s: Game in progress", client_display)
+                if self._send_frame(client_sock, static_frame("e", "msg", "Game in progress")):
                     time.sleep(0.1)
                 client_sock.close()
                 self.sel.unregister(client_sock)
+                self._drop_codec(client_sock)
             elif self.player_count >= 4:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Rejected client from {client_display}: Game full")
-                if self.send_message(client_sock, {"t": "e", "msg": "Game full"}):
+                logger.info("Rejected client from %s: Game full", client_display)
+                if self._send_frame(client_sock, static_frame("e", "msg", "Game full")):
                     time.sleep(0.1)
                 client_sock.close()
                 self.sel.unregister(client_sock)
+                self._drop_codec(client_sock)
             else:
                 # Get the next available slot instead of using player_count
                 slot = self._get_available_slot()
                 if slot == -1:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] No available slots for client from {client_display}")
-                    if self.send_message(client_sock, {"t": "e", "msg": "Game full"}):
+                    logger.info("No available slots for client from %s", client_display)
+                    if self._send_frame(client_sock, static_frame("e", "msg", "Game full")):
                         time.sleep(0.1)
                     client_sock.close()
                     self.sel.unregister(client_sock)
+                    self._drop_codec(client_sock)
                     return
                 
                 # Assign player to the available slot
                 self.clients[client_sock] = slot
-                self.sockets.append(client_sock)
                 self.player_slots[slot] = True
                 self.player_count += 1
                 
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {slot + 1} connected from {client_display}, total players: {self.player_count}")
+                logger.info("Player %d connected from %s, total players: %d", slot + 1, client_display, self.player_count)
                 
-                if self.send_message(client_sock, {"t": "w", "pid": slot}):
-                    self._broadcast({"t": "wt", "n": 4 - self.player_count})
-                    if self.game and self.last_game_state:
-                        self.send_message(client_sock, {"t": "gs", **self.last_game_state})
+                if self.send_message(client_sock, {"t": "w", "pid": slot, "caps": LOCAL_CAPS}):
+                    self._broadcast_frame(static_frame("wt", "n", 4 - self.player_count))
+                    if self.game and self.broadcast_baseline:
+                        self.send_message(client_sock, {"t": "gs", **self.broadcast_baseline})
                     if self.player_count == 4 and not self.game:
                         self._start_game()
                 else:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Failed to send welcome to player {slot + 1}, removing")
+                    logger.info("Failed to send welcome to player %d, removing", slot + 1)
                     self._remove_client(client_sock)
         except socket.error as e:
             logger.error(f"Accept error: {e}")
@@ -168,14 +385,25 @@ class Server:
     def _handle_client(self, sock: socket.socket, mask: int) -> None:
         if sock not in self.clients:
             return
-        message = self.receive_message(sock)
-        if message is None:
+        if mask & selectors.EVENT_WRITE:
+            self._handle_writable(sock)
+            if not mask & selectors.EVENT_READ or sock not in self.clients:
+                return
+        messages = self.receive_messages(sock)
+        if messages is None:
             self._remove_client(sock)
             return
-        if self.game:
+        for message in messages:
+            if message.get("t") == "h":
+                try:
+                    self.client_caps[sock] = int(message.get("caps", 0)) & LOCAL_CAPS
+                except (TypeError, ValueError):
+                    pass
+                continue
+            if not self.game or sock not in self.clients:
+                break
             try:
                 self._handle_action(sock, message)
-                self.last_game_state = self.game.serialize()
             except Exception as e:
                 logger.error(f"Error handling action: {e}")
                 self.send_message(sock, {"t": "e", "msg": f"Server error: {str(e)}"})
@@ -192,21 +420,20 @@ class Server:
         except:
             client_display = "unknown"
             
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_id + 1} disconnected from {client_display}")
+        logger.info("Player %d disconnected from %s", player_id + 1, client_display)
         
         # Handle game state if game is running
         if self.game and self.game.players[player_id]:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Moving Player {player_id + 1}'s {len(self.game.players[player_id])} cards to discard pile")
+            logger.info("Moving Player %d's %d cards to discard pile", player_id + 1, len(self.game.players[player_id]))
             self.game.discard_pile.extendleft(self.game.players[player_id])
             self.game.players[player_id].clear()
             if self.game.current_player == player_id:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Advancing turn from Player {player_id + 1}")
+                logger.info("Advancing turn from Player %d", player_id + 1)
                 self.game.next_turn()
         
         # Clean up client references
         del self.clients[sock]
-        if sock in self.sockets:
-            self.sockets.remove(sock)
+        self._drop_codec(sock)
         
         # Free up the player slot
         if 0 <= player_id < 4:
@@ -225,42 +452,39 @@ class Server:
         if self.game:
             self._broadcast_game_state()
         else:
-            self._broadcast({"t": "wt", "n": 4 - self.player_count})
+            self._broadcast_frame(static_frame("wt", "n", 4 - self.player_count))
 
     def _handle_action(self, sock: socket.socket, action: dict) -> None:
         """Handle client actions."""
         player_id = self.clients[sock]
         if action.get("t") == "p" and player_id == self.game.current_player:
             card_index = action.get("ci", -1)
-            print(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_id + 1} attempting to play card at index {card_index}")
+            logger.info("Player %d attempting to play card at index %s", player_id + 1, card_index)
             if self.game.play_card(player_id, card_index):
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_id + 1} played card successfully")
+                logger.info("Player %d played card successfully", player_id + 1)
                 if not self.game.players[player_id] and player_id not in self.finish_order:
                     self.finish_order.append(player_id)
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_id + 1} finished (no cards left)")
+                    logger.info("Player %d finished (no cards left)", player_id + 1)
                 self._broadcast_game_state()
             else:
-                self.send_message(sock, {"t": "e", "msg": "Invalid card play"})
+                self._send_frame(sock, static_frame("e", "msg", "Invalid card play"))
         elif action.get("t") == "d" and player_id == self.game.current_player:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_id + 1} drawing card")
+            logger.info("Player %d drawing card", player_id + 1)
             if self.game.draw_card(player_id):
                 self.game.next_turn()
                 self._broadcast_game_state()
             else:
-                self.send_message(sock, {"t": "e", "msg": "Cannot draw card: draw pile empty"})
+                self._send_frame(sock, static_frame("e", "msg", "Cannot draw card: draw pile empty"))
         else:
-            self.send_message(sock, {"t": "e", "msg": "Invalid action or not your turn"})
+            self._send_frame(sock, static_frame("e", "msg", "Invalid action or not your turn"))
 
     def _start_game(self) -> None:
         self.game = Game()
         self.game.create_deck()
         self.game.deal_cards()
         self.finish_order = []
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Game started with {self.player_count} players")
+        logger.info("Game started with %d players", self.player_count)
         self._broadcast_game_state()
-        self.last_game_state = self.game.serialize()
 
     def _end_game(self) -> None:
         winner = next((i for i, p in enumerate(self.game.players) if not p), None)
@@ -271,51 +495,92 @@ class Server:
         remaining.sort(key=lambda x: x[1])
         for pid, cards_left in remaining:
             results.append({"pid": pid, "rank": len(results) + 1, "cards_left": cards_left})
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Game over, winner: Player {winner + 1 if winner is not None else 'none'}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Final rankings: {results}")
+        logger.info("Game over, winner: Player %s", winner + 1 if winner is not None else "none")
+        logger.info("Final rankings: %s", results)
         self._broadcast({"t": "go", "w": winner + 1 if winner is not None else None, "results": results})
         
         # Clean up all client connections
         for sock in list(self.clients.keys()):
-            try:
-                sock.close()
-                self.sel.unregister(sock)
-            except:
-                pass  # Socket might already be closed
-            if sock in self.sockets:
-                self.sockets.remove(sock)
+            self._close_after_flush(sock)
         
         # Reset server state for new game
         self.clients.clear()
-        self.sockets.clear()
+        self.client_caps.clear()
+        self.compressors.clear()
+        self.decompressors.clear()
+        self.rx_buffers.clear()
+        self.rx_lengths.clear()
+        self.tx_buffers.clear()
+        self.state_cache.clear()
         self.player_slots = [False, False, False, False]
         self.player_count = 0
         self.game = None
         self.last_game_state = None
+        self.broadcast_baseline = None
         self.finish_order = []
-        self._broadcast({"t": "wt", "n": 4 - self.player_count})
+        self._broadcast_frame(static_frame("wt", "n", 4 - self.player_count))
 
     def _broadcast(self, message: dict) -> None:
+        # Encode once per advertised caps; the frame is shared unless it goes through a per-socket deflate stream.
+        payloads: Dict[int, bytes] = {}
+        frames: Dict[int, bytes] = {}
         failed = []
         for sock in list(self.clients.keys()):
-            if not self.send_message(sock, message):
+            caps = self.client_caps.get(sock, 0)
+            frame = frames.get(caps)
+            if frame is None:
+                data = payloads.get(caps)
+                if data is None:
+                    data = payloads[caps] = encode_payload(message, caps)
+                frame = self._encode_frame(data, sock, caps)
+                if len(data) < COMPRESS_MIN_SIZE or caps & ZSTD_FRAME_FLAG:
+                    frames[caps] = frame
+            if not self._send_frame(sock, frame):
                 failed.append(sock)
         for sock in failed:
             self._remove_client(sock)
 
+    def _broadcast_frame(self, frame: bytes) -> None:
+        failed = [sock for sock in list(self.clients.keys()) if not self._send_frame(sock, frame)]
+        for sock in failed:
+            self._remove_client(sock)
+
+    def _compute_delta(self, old: dict, new: dict) -> list:
+        """Diff two serialized states into ops: ["p", i, hand], ["a", key, tail] or ["r", key, value]."""
+        ops = []
+        for key, value in new.items():
+            old_value = old.get(key)
+            if value == old_value:
+                continue
+            if key == "players" and isinstance(old_value, list) and len(old_value) == len(value):
+                ops.extend(["p", i, hand] for i, (old_hand, hand) in enumerate(zip(old_value, value)) if hand != old_hand)
+            elif isinstance(value, list) and isinstance(old_value, list) and value[:len(old_value)] == old_value:
+                ops.append(["a", key, value[len(old_value):]])
+            else:
+                ops.append(["r", key, value])
+        return ops
+
     def _broadcast_game_state(self) -> None:
         if not self.game:
             return
         current_state = self.game.serialize()
-        if current_state != self.last_game_state:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
-                  f"Broadcasting game state: current_player={current_state['current_player'] + 1}")
-            self._broadcast({"t": "gs", **current_state})
+        if current_state != self.broadcast_baseline:
+            logger.info("Broadcasting game state: current_player=%d", current_state['current_player'] + 1)
+            if self.broadcast_baseline is None:
+                message = {"t": "gs", **current_state}
+            else:
+                message = {"t": "gd", "ops": self._compute_delta(self.broadcast_baseline, current_state)}
+            # Advance the baseline first: a failed send removes the client, which re-broadcasts from here.
+            self.broadcast_baseline = current_state
             self.last_game_state = current_state
+            self._broadcast(message)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Sedma bere tri server")
     parser.add_argument("--port", type=int, default=int(os.getenv("PORT", DEFAULT_PORT)), help="Port to listen on")
+    parser.add_argument("--verbose", action="store_true", help="Log connections and game events")
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR,
+                        format='[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S', force=True)
     server = Server(args.port)
     server.start()
\ No newline at end of file
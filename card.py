@@ -4,20 +4,56 @@ import logging
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+SEAT_ANGLES = (0, 90, 180, -90)
+ATLAS_COLUMNS = 8
+
 class Card:
+    __slots__ = ("name", "value", "suit", "image")
     _image_cache = {}
+    _rotated_cache = {}
+    _interned = {}
+
+    @classmethod
+    def get(cls, name: str, value: int, suit: str) -> "Card":
+        """Return the shared Card for name, creating it on first use."""
+        card = cls._interned.get(name)
+        if card is None:
+            card = cls._interned[name] = cls(name, value, suit)
+        return card
 
     @classmethod
     def preload_images(cls, card_names: list[str]) -> None:
-        for name in card_names:
-            if name not in cls._image_cache:
-                try:
-                    cls._image_cache[name] = pygame.transform.scale(
-                        pygame.image.load(f"assets/cards/default/{name}.png"), (80, 140)
-                    )
-                except pygame.error as e:
-                    logger.error(f"Error loading card image {name}: {e}")
-                    cls._image_cache[name] = pygame.Surface((80, 140))
+        # Match the display pixel format once a window exists so blits skip per-pixel conversion.
+        has_display = pygame.display.get_surface() is not None
+        names = [name for name in card_names if name not in cls._image_cache]
+        if not names:
+            return
+        images = []
+        for name in names:
+            try:
+                images.append(pygame.transform.scale(
+                    pygame.image.load(f"assets/cards/default/{name}.png"), (80, 140)
+                ))
+            except pygame.error as e:
+                logger.error(f"Error loading card image {name}: {e}")
+                images.append(pygame.Surface((80, 140)))
+        # Pack each seat angle's images into one atlas; every card keeps a subsurface view into it.
+        columns = min(ATLAS_COLUMNS, len(names))
+        for angle in SEAT_ANGLES:
+            rotated = [pygame.transform.rotate(image, angle) if angle else image for image in images]
+            cell_w = max(image.get_width() for image in rotated)
+            cell_h = max(image.get_height() for image in rotated)
+            rows = -(-len(rotated) // columns)
+            atlas = pygame.Surface((columns * cell_w, rows * cell_h), pygame.SRCALPHA)
+            if has_display:
+                atlas = atlas.convert_alpha()
+            for k, (name, image) in enumerate(zip(names, rotated)):
+                rect = pygame.Rect((k % columns) * cell_w, (k // columns) * cell_h, *image.get_size())
+                # Add onto the cleared atlas copies pixels exactly; alpha blending would darken soft edges.
+                atlas.blit(image, rect, special_flags=pygame.BLEND_RGBA_ADD)
+                cls._rotated_cache[(name, angle)] = atlas.subsurface(rect)
+        for name in names:
+            cls._image_cache[name] = cls._rotated_cache[(name, 0)]
 
     def __init__(self, name: str, value: int, suit: str):
         self.name = name
@@ -28,6 +64,14 @@ class Card:
     def _load_image(self) -> pygame.Surface:
         return self._image_cache.get(self.name, pygame.Surface((80, 140)))
 
+    def get_rotated(self, angle: float) -> pygame.Surface:
+        key = (self.name, angle)
+        image = self._rotated_cache.get(key)
+        if image is None:
+            image = pygame.transform.rotate(self.image, angle)
+            self._rotated_cache[key] = image
+        return image
+
     def __str__(self) -> str:
         return self.name
 
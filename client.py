@@ -2,17 +2,34 @@ import pygame
 import socket
 import json
 import select
+import selectors
 import struct
 import threading
 import errno
+import ipaddress
 import time
 import zlib
-from typing import List, Optional, Tuple, Dict
-from queue import Queue
+from typing import Callable, List, Optional, Tuple, Dict
+from queue import Queue, Empty
 from card import Card
-import re
+from game_logic import GS_DICTIONARY_SAMPLE
 import logging
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
@@ -31,8 +48,38 @@ BUTTON_HOVER_COLOR = (150, 150, 150)
 TEXT_COLOR = (255, 255, 255)
 PLACEHOLDER_COLOR = (150, 150, 150)
 LEADERBOARD_DURATION = 10
+# Frame rate caps: full rate only while playing, lower on static screens and lower still when nothing happens.
+GAME_FPS = 60
+MENU_FPS = 30
+IDLE_FPS = 15
 CUSTOMIZE_BUTTON_COLOR = (80, 80, 140)
 CUSTOMIZE_HOVER_COLOR = (120, 120, 200)
+TEXT_CACHE_SIZE = 256
+# Frame header is !IB: payload length, then flags describing the payload.
+FRAME_HEADER = struct.Struct('!IB')
+FRAME_ZLIB = 0x01
+FRAME_MSGPACK = 0x02
+COMPRESS_MIN_SIZE = 4096
+# Hot in-game requests skip the generic codec and travel as a two-byte opcode frame (opcode, card index).
+FRAME_OPCODE = 0x04
+OPCODE_FRAME = struct.Struct('!BB')
+FAST_OPCODES = {"p": 1, "d": 2, "leave_room": 3, "refresh_rooms": 4}
+FAST_MESSAGES = {opcode: t for t, opcode in FAST_OPCODES.items()}
+# Large payloads use zstd level 1 towards peers that advertise it, zlib otherwise; both are accepted on receive.
+FRAME_ZSTD = 0x08
+ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=1) if zstd else None
+ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor() if zstd else None
+# Game states are compressed at any size against a shared dictionary of their keys and card dicts,
+# for peers whose caps include FRAME_ZSTD_DICT.
+FRAME_ZSTD_DICT = 0x10
+ZSTD_GS_DICT = zstd.ZstdCompressionDict(GS_DICTIONARY_SAMPLE, dict_type=zstd.DICT_TYPE_RAWCONTENT) if zstd else None
+ZSTD_GS_DECOMPRESSOR = zstd.ZstdDecompressor(dict_data=ZSTD_GS_DICT) if zstd else None
+# Optional codecs are only used towards a peer that advertised them: each side sends the frame flags it can
+# decode as "caps" (client in set_name, server in lobby_welcome). JSON with zlib is what every peer understands.
+LOCAL_CAPS = (FRAME_MSGPACK if msgpack else 0) | (FRAME_ZSTD | FRAME_ZSTD_DICT if zstd else 0)
+RECV_CHUNK_SIZE = 65536
+SOCKET_BUFFER_SIZE = 1 << 20
+MAX_MESSAGES_PER_FRAME = 128
 
 ROOM_ITEM_COLOR = (60, 60, 80, 15)
 ROOM_ITEM_HOVER_COLOR = (80, 80, 100)
@@ -40,14 +87,72 @@ SUCCESS_COLOR = (0, 200, 0)
 ERROR_COLOR = (255, 100, 100)
 
 
-class CardSprite(pygame.sprite.Sprite):
+def encode_frame(message: dict, caps: int = 0) -> bytes:
+    opcode = FAST_OPCODES.get(message.get("t"))
+    if opcode is not None:
+        card_index = message.get("ci", 0)
+        if 0 <= card_index <= 0xFF:
+            return FRAME_HEADER.pack(OPCODE_FRAME.size, FRAME_OPCODE) + OPCODE_FRAME.pack(opcode, card_index)
+    if caps & FRAME_MSGPACK:
+        data, flags = msgpack.packb(message, use_bin_type=True), FRAME_MSGPACK
+    elif orjson:
+        data, flags = orjson.dumps(message), 0
+    else:
+        data, flags = json.dumps(message, separators=(',', ':')).encode(), 0
+    if len(data) >= COMPRESS_MIN_SIZE:
+        if caps & FRAME_ZSTD:
+            data, flags = ZSTD_COMPRESSOR.compress(data), flags | FRAME_ZSTD
+        else:
+            data, flags = zlib.compress(data, 1), flags | FRAME_ZLIB
+    return FRAME_HEADER.pack(len(data), flags) + data
+
+
+def decode_frame(flags: int, payload: bytes) -> dict:
+    if flags & FRAME_OPCODE:
+        opcode, card_index = OPCODE_FRAME.unpack(payload)
+        if opcode not in FAST_MESSAGES:
+            raise ValueError(f"Unknown opcode {opcode}")
+        message = {"t": FAST_MESSAGES[opcode]}
+        if opcode == FAST_OPCODES["p"]:
+            message["ci"] = card_index
+        return message
+    if flags & (FRAME_ZSTD | FRAME_ZSTD_DICT):
+        if zstd is None:
+            raise ValueError("zstd frame received but zstandard is not installed")
+        decompressor = ZSTD_GS_DECOMPRESSOR if flags & FRAME_ZSTD_DICT else ZSTD_DECOMPRESSOR
+        try:
+            payload = decompressor.decompress(payload)
+        except zstd.ZstdError as e:
+            raise ValueError(f"Corrupt zstd frame: {e}") from e
+    elif flags & FRAME_ZLIB:
+        payload = zlib.decompress(payload)
+    if flags & FRAME_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack frame received but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if orjson:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class CardSprite:
+    # Sprites live in plain per-player lists and are drawn with one blits call, so no Group bookkeeping is needed.
+    __slots__ = ("card", "image", "rect", "angle")
+
     def __init__(self, card: Card, x: int, y: int, angle: float):
-        super().__init__()
         self.card = card
-        self.image = pygame.transform.rotate(card.image, angle)
+        self.image = card.get_rotated(angle)
         self.rect = self.image.get_rect(topleft=(x, y))
         self.angle = angle
 
+    def set_card(self, card: Card, x: int, y: int, angle: float) -> None:
+        """Reuse this sprite for another card or slot, updating the rect in place."""
+        self.card = card
+        self.image = card.get_rotated(angle)
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (x, y)
+        self.angle = angle
+
 
 class LayoutManager:
     def __init__(self, screen_width: int, screen_height: int):
@@ -72,8 +177,15 @@ class LayoutManager:
             {"x": screen_width // 2, "y": 230, "align": "center", "angle": 180},
             {"x": 150, "y": screen_height // 2, "align": "center", "angle": -90}
         ]
+        self._hand_layouts: Dict[Tuple[int, int, bool], Tuple[Tuple[int, int, float], ...]] = {}
+
+    def layout_hand(self, pos_index: int, num_cards: int, is_local: bool = False) -> Tuple[Tuple[int, int, float], ...]:
+        """Return (x, y, angle) for every card of a hand; each (seat, size, is_local) is laid out only once."""
+        key = (pos_index, num_cards, is_local)
+        layout = self._hand_layouts.get(key)
+        if layout is not None:
+            return layout
 
-    def get_player_position(self, pos_index: int, num_cards: int, card_index: int, is_local: bool = False) -> Tuple[int, int, float]:
         pos = self.positions[pos_index]
         base_offset = 84
         if is_local:
@@ -86,19 +198,33 @@ class LayoutManager:
             overlap_increase = max(0, (num_cards - 3) * 4)
             offset = max(30, base_offset - overlap_increase)
 
-        x = pos["x"] - (num_cards * offset // 2) + (card_index * offset) if pos_index in [0, 2] else pos["x"]
-        y = pos["y"] - (num_cards * offset // 2) + (card_index * offset) if pos_index in [1, 3] else pos["y"]
-        return x, y, pos["angle"]
+        x, y, angle = pos["x"], pos["y"], pos["angle"]
+        start = -(num_cards * offset // 2)
+        if pos_index in (0, 2):
+            layout = tuple((x + start + j * offset, y, angle) for j in range(num_cards))
+        else:
+            layout = tuple((x, y + start + j * offset, angle) for j in range(num_cards))
+        self._hand_layouts[key] = layout
+        return layout
 
 
 class NetworkManager:
     def __init__(self, port: int = PORT):
         self.client_socket: Optional[socket.socket] = None
-        self.message_queue: Queue = Queue()
+        self.message_queue: Queue = Queue()  # Raw (flags, payload) frames; decoded by the consumer
         self.port = port
+        self._rx = bytearray(RECV_CHUNK_SIZE)  # Receive buffer filled in place by recv_into
+        self._rx_len = 0  # Bytes of _rx holding data not yet parsed into whole frames
+        self._tx: List[bytes] = []  # Encoded frames waiting for the end-of-frame flush
+        self.peer_caps = 0  # Frame flags the server advertised in lobby_welcome; plain JSON until then
 
     def connect(self, host: str) -> bool:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Messages are small and interactive, so don't let Nagle hold them back; the buffers are
+        # sized before connecting so the receive window is negotiated with them.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
         sock.setblocking(False)
         try:
             sock.connect((host, self.port))
@@ -111,6 +237,9 @@ class NetworkManager:
             _, writable, _ = select.select([], [sock], [], 5.0)
             if writable and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
                 self.client_socket = sock
+                self._rx_len = 0
+                self._tx.clear()
+                self.peer_caps = 0
                 return True
             else:
                 sock.close()
@@ -122,66 +251,117 @@ class NetworkManager:
 
     def disconnect(self) -> None:
         if self.client_socket:
+            self.flush()
             try:
                 self.client_socket.close()
             except socket.error as e:
                 logger.error(f"Error closing socket: {e}")
             self.client_socket = None
-        self.message_queue = Queue()
+        # Empty the queue in place so the consumer and any listener keep sharing the same object.
+        try:
+            while True:
+                self.message_queue.get_nowait()
+        except Empty:
+            pass
 
     def send_message(self, message: dict) -> bool:
+        if not self.client_socket:
+            return False
+        self._tx.append(encode_frame(message, self.peer_caps))
+        return True
+
+    def flush(self) -> bool:
+        """Send every frame queued by send_message since the last flush in a single write."""
+        if not self._tx:
+            return True
+        data = b"".join(self._tx)
+        self._tx.clear()
         if not self.client_socket:
             return False
         try:
-            data = zlib.compress(json.dumps(message, separators=(',', ':')).encode())
-            self.client_socket.sendall(struct.pack('!I', len(data)) + data)
+            self.client_socket.sendall(data)
             return True
         except socket.error as e:
             logger.error(f"Send error: {e}")
             return False
 
-    def receive_message(self, retries: int = 3, delay: float = 0.1) -> Optional[dict]:
+    def receive_frames(self) -> Optional[List[Tuple[int, bytes]]]:
+        """Drain what the socket has and return every complete (flags, payload) frame; None means the connection is gone."""
         sock = self.client_socket
         if sock is None:
             return None
-        buffer = b""
-        for _ in range(retries):
-            try:
-                if len(buffer) < 4:
-                    packet = sock.recv(4)
-                    if not packet:
-                        return None
-                    buffer += packet
-                length = struct.unpack('!I', buffer[:4])[0]
-                while len(buffer) - 4 < length:
-                    packet = sock.recv(length - (len(buffer) - 4))
-                    if not packet:
-                        return None
-                    buffer += packet
-                data = json.loads(zlib.decompress(buffer[4:]).decode())
-                return data
-            except socket.error as e:
-                if hasattr(e, 'winerror') and e.winerror == 10038:
-                    return None
-                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                    time.sleep(delay)
-                    continue
-                logger.error(f"Receive error: {e}")
+        rx = self._rx
+        rx_len = self._rx_len
+        if rx_len == len(rx):
+            # A frame larger than the buffer is still arriving; grow instead of passing recv_into an empty view.
+            rx.extend(bytes(len(rx)))
+        try:
+            with memoryview(rx)[rx_len:] as free:
+                received = sock.recv_into(free)
+        except socket.error as e:
+            if hasattr(e, 'winerror') and e.winerror == 10038:
                 return None
-            except (json.JSONDecodeError, struct.error, zlib.error) as e:
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            logger.error(f"Receive error: {e}")
+            return None
+        if not received:
+            return None
+        rx_len += received
+        frames = []
+        header_size = FRAME_HEADER.size
+        pos = 0
+        while rx_len - pos >= header_size:
+            length, flags = FRAME_HEADER.unpack_from(rx, pos)
+            end = pos + header_size + length
+            if rx_len < end:
+                break
+            # The payload is copied out once, since the buffer is reused while the frame waits in the queue.
+            with memoryview(rx)[pos + header_size:end] as payload:
+                frames.append((flags, payload.tobytes()))
+            pos = end
+        if pos:
+            # Move the unfinished tail to the front; the buffer keeps its capacity.
+            rx[:rx_len - pos] = rx[pos:rx_len]
+            rx_len -= pos
+        self._rx_len = rx_len
+        return frames
+
+    def get_messages(self, limit: int = MAX_MESSAGES_PER_FRAME) -> List[dict]:
+        """Take up to limit queued frames and decode them; anything left waits for the next frame."""
+        frames = []
+        try:
+            while len(frames) < limit:
+                frames.append(self.message_queue.get_nowait())
+        except Empty:
+            pass
+        messages = []
+        for flags, payload in frames:
+            try:
+                messages.append(decode_frame(flags, payload))
+            except (ValueError, struct.error, zlib.error) as e:
                 logger.error(f"Decode error: {e}")
-                return None
-        return None
+        return messages
 
     def start_listener(self, running_flag, message_callback):
+        sock = self.client_socket
+
         def listen():
-            while running_flag[0]:
-                if self.client_socket is None:
-                    break
-                message = self.receive_message()
-                if message:
-                    self.message_queue.put(message)
-                time.sleep(0.01)
+            with selectors.DefaultSelector() as sel:
+                sel.register(sock, selectors.EVENT_READ)
+                # Sleep in select until data arrives; the timeout only bounds how long a stop request waits.
+                while running_flag[0] and self.client_socket is sock:
+                    try:
+                        if not sel.select(timeout=0.25):
+                            continue
+                    except (OSError, ValueError):
+                        break  # Socket was closed under us by disconnect()
+                    # Only framing happens here; decompression and decoding are left to the main thread.
+                    frames = self.receive_frames()
+                    if frames is None:
+                        break
+                    for frame in frames:
+                        self.message_queue.put(frame)
 
         threading.Thread(target=listen, daemon=True).start()
 
@@ -215,15 +395,19 @@ class InputField:
         self.text = ""
         self.active = False
         self.max_len = max_len
+        self._rendered_key: Optional[Tuple[str, Tuple[int, int, int]]] = None
+        self._rendered: Optional[pygame.Surface] = None
 
     def draw(self, screen: pygame.Surface, mouse_pos: Tuple[int, int]) -> None:
         bg_color = BUTTON_HOVER_COLOR if self.active else self.bg_color
         pygame.draw.rect(screen, bg_color, self.rect)
         display_text = self.text or self.placeholder
         text_color = TEXT_COLOR if self.text else PLACEHOLDER_COLOR
-        surface = self.font.render(display_text, True, text_color)
-        text_rect = surface.get_rect(center=self.rect.center)
-        screen.blit(surface, text_rect)
+        if self._rendered_key != (display_text, text_color):
+            self._rendered_key = (display_text, text_color)
+            self._rendered = self.font.render(display_text, True, text_color)
+        text_rect = self._rendered.get_rect(center=self.rect.center)
+        screen.blit(self._rendered, text_rect)
 
     def handle_key(self, event) -> bool:
         if not self.active:
@@ -264,7 +448,13 @@ class Renderer:
         self.small_font = small_font
         self.background: Optional[pygame.Surface] = None
         self.card_back: Optional[pygame.Surface] = None
-
+        self.card_cache: Dict[str, Card] = {}
+        self._bg_cache: Dict[str, pygame.Surface] = {}
+        self.card_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []  # Every hand's sprites, drawn with one blits call
+        self.local_hand_rects: List[pygame.Rect] = []  # Hit areas of the local player's cards, in hand order
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._dirty = True  # Nothing is time-animated, so frames are only repainted after an event or message
+        self._hovered: Tuple[int, ...] = ()  # Indices of the hover rects under the mouse when last painted
 
         # Customization defaults
         self.background_options = [
@@ -282,47 +472,121 @@ class Renderer:
         self.current_background_path = f"assets/backgrounds/{self.selected_background}"
         self.current_card_back_path = f"assets/cards/{self.selected_card_theme}/back.png"
 
+        # Fixed widget rects are built once; only the room list grows with the number of rooms.
+        self.background_option_rects = [pygame.Rect(100, 210 + i * 55, 340, 45) for i in range(len(self.background_options))]
+        self.card_theme_rects = [pygame.Rect(SCREEN_WIDTH // 2 + 30, 210 + i * 55, 340, 45)
+                                 for i in range(len(self.card_back_themes))]
+        self.apply_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT - 100, 200, 60)
+        self.cancel_rect = pygame.Rect(SCREEN_WIDTH // 2 + 40, SCREEN_HEIGHT - 100, 200, 60)
+        self.player_count_rects = [(val, pygame.Rect(50 + i * 50, 210, 40, 30)) for i, val in enumerate((2, 3, 4))]
+        self.rooms_list_rect = pygame.Rect(300, 150, SCREEN_WIDTH - 350, SCREEN_HEIGHT - 200)
+        self.leave_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
+        self._room_rects: List[pygame.Rect] = []
+        self._nameplates_key: Optional[Tuple] = None
+        self._nameplates: List[Tuple[Tuple[pygame.Surface, pygame.Rect], ...]] = []
+
+    def _name_plates(self, num_players: int, local_player: int,
+                     player_names: Dict[int, str]) -> List[Tuple[Tuple[pygame.Surface, pygame.Rect], ...]]:
+        """(normal, active) rotated name plate and its rect per player index, rebuilt only when the seating changes."""
+        names = tuple(player_names.get(i, f"Unknown ({i + 1})") for i in range(num_players))
+        key = (num_players, local_player, names)
+        if key != self._nameplates_key:
+            self._nameplates = []
+            for i, name in enumerate(names):
+                # Rotate so the local player's plate sits at the bottom.
+                name_pos = self.layout.name_positions[(i - local_player) % num_players]
+                center = (name_pos["x"], name_pos["y"])
+                plates = []
+                for color in (TEXT_COLOR, HIGHLIGHT_COLOR):
+                    surface = pygame.transform.rotate(self.font.render(name, True, color), name_pos["angle"])
+                    plates.append((surface, surface.get_rect(center=center)))
+                self._nameplates.append(tuple(plates))
+            self._nameplates_key = key
+        return self._nameplates
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def consume_dirty(self) -> bool:
+        """Whether a full repaint is due since the last call; clears the flag."""
+        dirty, self._dirty = self._dirty, False
+        return dirty
+
+    @staticmethod
+    def _hits(hover_rects: List[pygame.Rect]) -> Tuple[int, ...]:
+        return tuple(pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelistall(hover_rects))
+
+    def present(self, draw_frame: Callable[[], None], hover_rects: List[pygame.Rect]) -> None:
+        """Paint a full frame and remember which of hover_rects the mouse is over."""
+        draw_frame()
+        pygame.display.flip()
+        self._hovered = self._hits(hover_rects)
+
+    def repaint_hover(self, draw_frame: Callable[[], None], hover_rects: List[pygame.Rect]) -> None:
+        """Repaint, clipped, only the hover_rects the mouse entered or left since the last paint."""
+        hovered = self._hits(hover_rects)
+        if hovered == self._hovered:
+            return
+        dirty_rects = [hover_rects[i] for i in set(self._hovered).symmetric_difference(hovered)]
+        for rect in dirty_rects:
+            self.screen.set_clip(rect)
+            draw_frame()
+        self.screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+        self._hovered = hovered
+
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (id(font), text, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # Re-inserting keeps the dict ordered from least to most recently used.
+        self._text_cache[key] = surface
+        return surface
+
+    def get_card(self, name: str, value: int, suit: str) -> Card:
+        card = self.card_cache.get(name)
+        if card is None:
+            card = self.card_cache[name] = Card.get(name, value, suit)
+        return card
+
     def render_customize(self, mouse_pos: Tuple[int, int]) -> None:
         self.screen.fill(BACKGROUND_COLOR)
         if self.background:
             self.screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render("Customize", True, TEXT_COLOR)
+        title = self._text(self.title_font, "Customize", TEXT_COLOR)
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 80)))
 
         # Background section
-        bg_title = self.font.render("Background", True, TEXT_COLOR)
+        bg_title = self._text(self.font, "Background", TEXT_COLOR)
         self.screen.blit(bg_title, (120, 160))
 
-        y = 210
-        for bg in self.background_options:
-            rect = pygame.Rect(100, y, 340, 45)
+        for bg, rect in zip(self.background_options, self.background_option_rects):
             color = CUSTOMIZE_HOVER_COLOR if rect.collidepoint(mouse_pos) else BUTTON_COLOR
             if bg == self.selected_background:
                 color = (0, 180, 0)
             pygame.draw.rect(self.screen, color, rect, border_radius=8)
-            label = self.font.render(bg.replace(".png", "").replace("_", " ").title(), True, TEXT_COLOR)
-            self.screen.blit(label, (130, y + 10))
-            y += 55
+            label = self._text(self.font, bg.replace(".png", "").replace("_", " ").title(), TEXT_COLOR)
+            self.screen.blit(label, (130, rect.y + 10))
 
         # Card back section
-        card_title = self.font.render("Card Back", True, TEXT_COLOR)
+        card_title = self._text(self.font, "Card Back", TEXT_COLOR)
         self.screen.blit(card_title, (SCREEN_WIDTH // 2 + 50, 160))
 
-        y = 210
-        for theme in self.card_back_themes:
-            rect = pygame.Rect(SCREEN_WIDTH // 2 + 30, y, 340, 45)
+        for theme, rect in zip(self.card_back_themes, self.card_theme_rects):
             color = CUSTOMIZE_HOVER_COLOR if rect.collidepoint(mouse_pos) else BUTTON_COLOR
             if theme == self.selected_card_theme:
                 color = (0, 180, 0)
             pygame.draw.rect(self.screen, color, rect, border_radius=8)
-            label = self.font.render(theme.capitalize(), True, TEXT_COLOR)
-            self.screen.blit(label, (SCREEN_WIDTH // 2 + 60, y + 10))
-            y += 55
+            label = self._text(self.font, theme.capitalize(), TEXT_COLOR)
+            self.screen.blit(label, (SCREEN_WIDTH // 2 + 60, rect.y + 10))
 
         # Buttons
-        apply_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT - 100, 200, 60)
-        cancel_rect = pygame.Rect(SCREEN_WIDTH // 2 + 40, SCREEN_HEIGHT - 100, 200, 60)
+        apply_rect = self.apply_rect
+        cancel_rect = self.cancel_rect
 
         apply_color = BUTTON_HOVER_COLOR if apply_rect.collidepoint(mouse_pos) else BUTTON_COLOR
         cancel_color = BUTTON_HOVER_COLOR if cancel_rect.collidepoint(mouse_pos) else BUTTON_COLOR
@@ -330,24 +594,31 @@ class Renderer:
         pygame.draw.rect(self.screen, apply_color, apply_rect, border_radius=10)
         pygame.draw.rect(self.screen, cancel_color, cancel_rect, border_radius=10)
 
-        apply_txt = self.font.render("Apply & Return", True, TEXT_COLOR)
-        cancel_txt = self.font.render("Cancel", True, TEXT_COLOR)
+        apply_txt = self._text(self.font, "Apply & Return", TEXT_COLOR)
+        cancel_txt = self._text(self.font, "Cancel", TEXT_COLOR)
 
         self.screen.blit(apply_txt, apply_txt.get_rect(center=apply_rect.center))
         self.screen.blit(cancel_txt, cancel_txt.get_rect(center=cancel_rect.center))
 
+    def _load_background(self, background_path: str) -> pygame.Surface:
+        background = self._bg_cache.get(background_path)
+        if background is None:
+            try:
+                background = pygame.image.load(background_path).convert()
+                if background.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                    background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            except pygame.error as e:
+                logger.warning(f"Failed to load background {background_path}: {e}")
+                background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+                background.fill((20, 60, 20))
+            self._bg_cache[background_path] = background
+        return background
+
     def load_assets(self, background_path: str, card_back_path: str, size: Tuple[int, int]) -> None:
-        try:
-            self.background = pygame.image.load(background_path)
-            if self.background.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        except pygame.error as e:
-            logger.warning(f"Failed to load background {background_path}: {e}")
-            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.background.fill((20, 60, 20))
+        self.background = self._load_background(background_path)
 
         try:
-            self.card_back = pygame.transform.scale(pygame.image.load(card_back_path), size)
+            self.card_back = pygame.transform.scale(pygame.image.load(card_back_path), size).convert_alpha()
         except pygame.error as e:
             logger.warning(f"Failed to load card back {card_back_path}: {e}")
             self.card_back = pygame.Surface(size)
@@ -359,93 +630,91 @@ class Renderer:
         if self.background:
             self.screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render("Sedma Bere Tri", True, TEXT_COLOR)
+        mouse_pos = pygame.mouse.get_pos()
+        title = self._text(self.title_font, "Sedma Bere Tri", TEXT_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 250))
         self.screen.blit(title, title_rect)
 
-        ip_label = self.font.render("Server IP:", True, TEXT_COLOR)
+        ip_label = self._text(self.font, "Server IP:", TEXT_COLOR)
         self.screen.blit(ip_label, (ip_field.rect.x, ip_field.rect.y - 30))
-        ip_field.draw(self.screen, pygame.mouse.get_pos())
+        ip_field.draw(self.screen, mouse_pos)
 
-        name_label = self.font.render("Your Name:", True, TEXT_COLOR)
+        name_label = self._text(self.font, "Your Name:", TEXT_COLOR)
         self.screen.blit(name_label, (name_field.rect.x, name_field.rect.y - 30))
-        name_field.draw(self.screen, pygame.mouse.get_pos())
+        name_field.draw(self.screen, mouse_pos)
 
-        mouse_pos = pygame.mouse.get_pos()
         connect_btn.draw(self.screen, mouse_pos)
         close_btn.draw(self.screen, mouse_pos)
 
         if waiting_message:
             msg_color = ERROR_COLOR if "error" in waiting_message.lower() or "please" in waiting_message.lower() else TEXT_COLOR
-            msg_surface = self.font.render(waiting_message, True, msg_color)
+            msg_surface = self._text(self.font, waiting_message, msg_color)
             msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
             self.screen.blit(msg_surface, msg_rect)
 
     def render_lobby(self, background_path: str, player_name: str, room_name_field: InputField, create_btn: UIElement,
                      refresh_btn: UIElement,
                      disconnect_btn: UIElement, rooms_list: List[Dict], waiting_message: Optional[str]) -> None:
-        # existing setup...
-        self.background = pygame.image.load(background_path)
+        mouse_pos = pygame.mouse.get_pos()
+        self.background = self._load_background(background_path)
         self.screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render(f"Playing as: {player_name}", True, TEXT_COLOR)
+        title = self._text(self.title_font, f"Playing as: {player_name}", TEXT_COLOR)
         self.screen.blit(title, (50, 20))
 
-        create_label = self.font.render("Create Room:", True, TEXT_COLOR)
+        create_label = self._text(self.font, "Create Room:", TEXT_COLOR)
         self.screen.blit(create_label, (50, 120))
-        room_name_field.draw(self.screen, pygame.mouse.get_pos())
+        room_name_field.draw(self.screen, mouse_pos)
 
-        mouse_pos = pygame.mouse.get_pos()
         create_btn.draw(self.screen, mouse_pos)
         refresh_btn.draw(self.screen, mouse_pos)
 
-        # Player count selector (2 / 3 / 4) — moved down to y=210
-        pc_base_x = 50
-        pc_y = 210
-        pc_width = 40
-        pc_height = 30
-        for i, val in enumerate([2, 3, 4]):
-            rect = pygame.Rect(pc_base_x + i * 50, pc_y, pc_width, pc_height)
+        # Player count selector (2 / 3 / 4)
+        for val, rect in self.player_count_rects:
             is_selected = getattr(self, "selected_room_max_players", 4) == val
             color = (0, 180, 0) if is_selected else (
                 CUSTOMIZE_HOVER_COLOR if rect.collidepoint(mouse_pos) else BUTTON_COLOR)
             pygame.draw.rect(self.screen, color, rect, border_radius=6)
-            label = self.small_font.render(str(val), True, TEXT_COLOR)
+            label = self._text(self.small_font, str(val), TEXT_COLOR)
             self.screen.blit(label, label.get_rect(center=rect.center))
 
-        self._render_room_list(rooms_list)
+        self._render_room_list(rooms_list, mouse_pos)
 
         disconnect_btn.draw(self.screen, mouse_pos)
 
         if waiting_message:
             msg_color = ERROR_COLOR if "error" in waiting_message.lower() else SUCCESS_COLOR if "joined" in waiting_message.lower() else TEXT_COLOR
-            msg_surface = self.font.render(waiting_message, True, msg_color)
+            msg_surface = self._text(self.font, waiting_message, msg_color)
             msg_rect = msg_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
             self.screen.blit(msg_surface, msg_rect)
 
-    def _render_room_list(self, rooms_list: List[Dict]) -> None:
-        list_title = self.font.render("Available Rooms (click to join):", True, TEXT_COLOR)
+    def _render_room_list(self, rooms_list: List[Dict], mouse_pos: Tuple[int, int]) -> None:
+        list_title = self._text(self.font, "Available Rooms (click to join):", TEXT_COLOR)
         self.screen.blit(list_title, (300, 120))
 
-        rooms_list_rect = pygame.Rect(300, 150, SCREEN_WIDTH - 350, SCREEN_HEIGHT - 200)
+        rooms_list_rect = self.rooms_list_rect
         room_item_height = 80
         pygame.draw.rect(self.screen, ROOM_ITEM_COLOR, rooms_list_rect)
 
         if not rooms_list:
-            no_rooms_text = self.font.render("No rooms available. Create one!", True, PLACEHOLDER_COLOR)
+            no_rooms_text = self._text(self.font, "No rooms available. Create one!", PLACEHOLDER_COLOR)
             text_rect = no_rooms_text.get_rect(center=rooms_list_rect.center)
             self.screen.blit(no_rooms_text, text_rect)
             return
 
-        mouse_pos = pygame.mouse.get_pos()
-        y_offset = 0
         details_color = (200, 200, 200)
+        for i in range(len(self._room_rects), len(rooms_list)):
+            self._room_rects.append(pygame.Rect(rooms_list_rect.x + 10, rooms_list_rect.y + i * room_item_height + 5,
+                                                rooms_list_rect.width - 20, room_item_height - 5))
+
+        # Rows are evenly spaced, so the hovered row is found arithmetically instead of testing every rect.
+        hovered = (mouse_pos[1] - rooms_list_rect.y) // room_item_height
+        if not (0 <= hovered < len(rooms_list) and self._room_rects[hovered].collidepoint(mouse_pos)):
+            hovered = -1
 
-        for i, room in enumerate(rooms_list):
-            room_rect = pygame.Rect(rooms_list_rect.x + 10, rooms_list_rect.y + y_offset + 5,
-                                    rooms_list_rect.width - 20, room_item_height - 5)
+        for i, (room, room_rect) in enumerate(zip(rooms_list, self._room_rects)):
 
-            hover_color = ROOM_ITEM_HOVER_COLOR if room_rect.collidepoint(mouse_pos) else ROOM_ITEM_COLOR
+            hover_color = ROOM_ITEM_HOVER_COLOR if i == hovered else ROOM_ITEM_COLOR
             if not room.get("in_game", False) and room.get("players", 0) < room.get("max_players", 4):
                 pygame.draw.rect(self.screen, hover_color, room_rect)
             else:
@@ -457,47 +726,45 @@ class Renderer:
             max_players = room.get("max_players", 4)
             in_game = room.get("in_game", False)
 
-            title_text = self.font.render(room_name, True, TEXT_COLOR)
+            title_text = self._text(self.font, room_name, TEXT_COLOR)
             self.screen.blit(title_text, (room_rect.x + 10, room_rect.y + 8))
 
             creator_text = f"by {creator}"
-            creator_surface = self.small_font.render(creator_text, True, details_color)
+            creator_surface = self._text(self.small_font, creator_text, details_color)
             self.screen.blit(creator_surface, (room_rect.x + 10, room_rect.y + 32))
 
             players_text = f"{players}/{max_players} players"
             if in_game:
                 players_text += " (IN GAME)"
-            players_surface = self.small_font.render(players_text, True, details_color)
+            players_surface = self._text(self.small_font, players_text, details_color)
             self.screen.blit(players_surface, (room_rect.x + 10, room_rect.y + 50))
 
-            y_offset += room_item_height
 
 
-
-    def render_game(self, state_manager: StateManager, card_sprites: Dict[int, pygame.sprite.Group],
+    def render_game(self, state_manager: StateManager, card_sprites: List[List[CardSprite]],
                     current_room_name: str, mouse_pos: Tuple[int, int], waiting_message: Optional[str]) -> None:
         self.screen.fill(BACKGROUND_COLOR)
         if self.background:
             self.screen.blit(self.background, (0, 0))
 
         if current_room_name:
-            room_info = self.title_font.render(f"Room: {current_room_name}", True, TEXT_COLOR)
+            room_info = self._text(self.title_font, f"Room: {current_room_name}", TEXT_COLOR)
             self.screen.blit(room_info, (10, 10))
 
         if waiting_message:
-            msg_surface = self.font.render(waiting_message, True, TEXT_COLOR)
+            msg_surface = self._text(self.font, waiting_message, TEXT_COLOR)
             self.screen.blit(msg_surface, (10, 50))
 
-        leave_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
+        leave_rect = self.leave_rect
         leave_color = BUTTON_HOVER_COLOR if leave_rect.collidepoint(mouse_pos) else BUTTON_COLOR
         pygame.draw.rect(self.screen, leave_color, leave_rect)
-        leave_text = self.font.render("Leave Room", True, TEXT_COLOR)
+        leave_text = self._text(self.font, "Leave Room", TEXT_COLOR)
         leave_rect_center = leave_text.get_rect(center=leave_rect.center)
         self.screen.blit(leave_text, leave_rect_center)
 
         if state_manager.state == "room_waiting":
             if state_manager.waiting_message:
-                wait_text = self.title_font.render(state_manager.waiting_message, True, TEXT_COLOR)
+                wait_text = self._text(self.title_font, state_manager.waiting_message, TEXT_COLOR)
                 wait_rect = wait_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
                 self.screen.blit(wait_text, wait_rect)
         elif state_manager.state == "playing" and state_manager.game_state and state_manager.local_player is not None:
@@ -505,19 +772,16 @@ class Renderer:
             player_names = state_manager.game_state.get("player_names", {})
 
             if not state_manager.render_debug_done:
-                print("[DEBUG START] Player names at game start:")
+                logger.debug("Player names at game start:")
                 for i in range(state_manager.num_players):
-                    player_name = player_names.get(i, f"Unknown ({i + 1})")
-                    print(f"  Slot {i}: '{player_name}' (from dict: {player_names.get(i, 'MISSING')})")
+                    logger.debug("  Slot %d: %r", i, player_names.get(i, "MISSING"))
                 state_manager.render_debug_done = True
 
-            for i in range(state_manager.num_players):  # ← changed
-                if card_sprites[i]:
-                    card_sprites[i].draw(self.screen)
-                    if i == state_manager.local_player and current_player == state_manager.local_player:
-                        for sprite in card_sprites[i]:
-                            if sprite.rect.collidepoint(mouse_pos):
-                                pygame.draw.rect(self.screen, HIGHLIGHT_COLOR, sprite.rect, CARD_HIGHLIGHT_THICKNESS)
+            self.screen.blits(self.card_blits, doreturn=False)
+            if current_player == state_manager.local_player:
+                hand_rects = self.local_hand_rects
+                for i in pygame.Rect(mouse_pos, (1, 1)).collidelistall(hand_rects):
+                    pygame.draw.rect(self.screen, HIGHLIGHT_COLOR, hand_rects[i], CARD_HIGHLIGHT_THICKNESS)
 
             draw_pile_rect = self.layout.draw_pile_rect
             if draw_pile_rect.collidepoint(mouse_pos):
@@ -527,27 +791,20 @@ class Renderer:
                 self.screen.blit(self.card_back, (draw_pile_rect.topleft[0] + 3, draw_pile_rect.topleft[1] + 3))
 
             if state_manager.game_state.get("discard_pile"):
-                card_key = state_manager.game_state["discard_pile"][-1]["name"]
-                card = Card(card_key, state_manager.game_state["discard_pile"][-1]["value"],
-                            state_manager.game_state["discard_pile"][-1]["suit"])
+                top = state_manager.game_state["discard_pile"][-1]
+                card = self.get_card(top["name"], top["value"], top["suit"])
                 card.draw(self.screen, *self.layout.discard_pile_pos)
 
-            for i in range(state_manager.num_players):
-                pos_index = (i - state_manager.local_player) % state_manager.num_players  # ← changed %4 → %num_players
-                name_pos = self.layout.name_positions[pos_index]
-                name_color = HIGHLIGHT_COLOR if i == current_player else TEXT_COLOR
-                player_name = player_names.get(i, f"Unknown ({i + 1})")
-                name_text = self.font.render(player_name, True, name_color)
-                rotated_name = pygame.transform.rotate(name_text, name_pos["angle"])
-                name_rect = rotated_name.get_rect(center=(name_pos["x"], name_pos["y"]))
-                self.screen.blit(rotated_name, name_rect)
+            plates = self._name_plates(state_manager.num_players, state_manager.local_player, player_names)
+            for i, (normal, active) in enumerate(plates):
+                self.screen.blit(*(active if i == current_player else normal))
 
     def render_leaderboard(self, state_manager: StateManager, mouse_pos: Tuple[int, int]) -> None:
         self.screen.fill(BACKGROUND_COLOR)
         if self.background:
             self.screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render("Game Over", True, TEXT_COLOR)
+        title = self._text(self.title_font, "Game Over", TEXT_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
         self.screen.blit(title, title_rect)
 
@@ -563,14 +820,14 @@ class Renderer:
                     text = f"{rank}. {player_name} (disconnected)"
                 else:
                     text = f"{rank}. {player_name}"
-                text_surface = self.font.render(text, True, TEXT_COLOR)
+                text_surface = self._text(self.font, text, TEXT_COLOR)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 + (i + 1) * 50))
                 self.screen.blit(text_surface, text_rect)
 
-        leave_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
+        leave_rect = self.leave_rect
         leave_color = BUTTON_HOVER_COLOR if leave_rect.collidepoint(mouse_pos) else BUTTON_COLOR
         pygame.draw.rect(self.screen, leave_color, leave_rect)
-        leave_text = self.font.render("Back to Lobby", True, TEXT_COLOR)
+        leave_text = self._text(self.font, "Back to Lobby", TEXT_COLOR)
         leave_rect_center = leave_text.get_rect(center=leave_rect.center)
         self.screen.blit(leave_text, leave_rect_center)
 
@@ -585,15 +842,25 @@ class EventHandler:
         self.input_fields = input_fields
         self.ui_elements = ui_elements
         self.last_click_time: int = 0
-        self.card_sprites: Dict[int, pygame.sprite.Group] = {i: pygame.sprite.Group() for i in range(4)}
+        self.card_sprites: List[List[CardSprite]] = []  # One list per player, sized once num_players is known
+        self._slot_names_cache: Tuple[Dict, Dict[int, str]] = ({}, {})  # (wire table, int-keyed copy)
+        self._hand_signature: Optional[Tuple] = None  # (seating, card names per hand) the sprites were last built for
         self.card_rects: List[pygame.Rect] = []
-        self.card_cache: Dict[str, Card] = {}
+        self.card_cache: Dict[str, Card] = renderer.card_cache  # Shared so render_game reuses the same Card objects
         self.player_name = ""
         self.name_set = False
         self.default_name_counter = 1
         self.current_room_id = None
         self.current_room_name = ""
         self.rooms_list: List[Dict] = []
+        self._click_handlers = {
+            "menu": self._handle_menu_click,
+            "customize": self._handle_customize_click,
+            "lobby": self._handle_lobby_click,
+            "room_waiting": self._handle_room_waiting_click,
+            "playing": self._handle_game_click,
+            "leaderboard": self._handle_leaderboard_click,
+        }
 
         # New: selected max players for create-room UI (2/3/4)
         self.selected_max_players: int = 4
@@ -601,10 +868,13 @@ class EventHandler:
         self.renderer.selected_room_max_players = self.selected_max_players
 
     def validate_ip(self, ip: str) -> bool:
-        if ip.lower() in ['localhost', '127.0.0.1']:
+        if ip.lower() in ('localhost', '127.0.0.1'):
             return True
-        pattern = r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$'
-        return bool(re.match(pattern, ip))
+        try:
+            ipaddress.IPv4Address(ip)
+        except ValueError:
+            return False
+        return True
 
     def handle_click(self, pos: Tuple[int, int]) -> None:
         current_time = pygame.time.get_ticks()
@@ -612,20 +882,9 @@ class EventHandler:
             return
         self.last_click_time = current_time
 
-        if self.state_manager.state == "menu":
-            self._handle_menu_click(pos)
-            if self.ui_elements.get("customize") and self.ui_elements["customize"].rect.collidepoint(pos):
-                self.state_manager.state = "customize"
-        elif self.state_manager.state == "customize":
-            self._handle_customize_click(pos)
-        elif self.state_manager.state == "lobby":
-            self._handle_lobby_click(pos)
-        elif self.state_manager.state == "room_waiting":
-            self._handle_room_waiting_click(pos)
-        elif self.state_manager.state == "playing":
-            self._handle_game_click(pos)
-        elif self.state_manager.state == "leaderboard":
-            self._handle_leaderboard_click(pos)
+        handler = self._click_handlers.get(self.state_manager.state)
+        if handler:
+            handler(pos)
 
     def _handle_menu_click(self, pos: Tuple[int, int]) -> None:
         ip_field = self.input_fields["ip"]
@@ -648,47 +907,35 @@ class EventHandler:
         elif close_btn.rect.collidepoint(pos):
             raise SystemExit(0)
 
+        if self.ui_elements.get("customize") and self.ui_elements["customize"].rect.collidepoint(pos):
+            self.state_manager.state = "customize"
+
     def _handle_customize_click(self, pos: Tuple[int, int]) -> None:
-        mouse_pos = pos
+        renderer = self.renderer
+        click_rect = pygame.Rect(pos, (1, 1))
 
         # Background selection
-        y = 210
-        for bg in self.renderer.background_options:
-            rect = pygame.Rect(100, y, 340, 45)
-            if rect.collidepoint(mouse_pos):
-                self.renderer.selected_background = bg
-                self.renderer.current_background_path = f"assets/backgrounds/{bg}"
-                self.renderer.load_assets(
-                    self.renderer.current_background_path,
-                    self.renderer.current_card_back_path,
-                    (CARD_WIDTH, CARD_HEIGHT)
-                )
-                return
-            y += 55
+        i = click_rect.collidelist(renderer.background_option_rects)
+        if i != -1:
+            bg = renderer.background_options[i]
+            renderer.selected_background = bg
+            renderer.current_background_path = f"assets/backgrounds/{bg}"
+            renderer.load_assets(renderer.current_background_path, renderer.current_card_back_path,
+                                 (CARD_WIDTH, CARD_HEIGHT))
+            return
 
         # Card back selection
-        y = 210
-        for theme in self.renderer.card_back_themes:
-            rect = pygame.Rect(SCREEN_WIDTH // 2 + 30, y, 340, 45)
-            if rect.collidepoint(mouse_pos):
-                self.renderer.selected_card_theme = theme
-                self.renderer.current_card_back_path = f"assets/cards/{theme}/back.png"
-                self.renderer.load_assets(
-                    self.renderer.current_background_path,
-                    self.renderer.current_card_back_path,
-                    (CARD_WIDTH, CARD_HEIGHT)
-                )
-                return
-            y += 55
-
-        # Apply & Return
-        apply_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, SCREEN_HEIGHT - 100, 200, 60)
-        if apply_rect.collidepoint(mouse_pos):
-            self.state_manager.state = "menu"
+        i = click_rect.collidelist(renderer.card_theme_rects)
+        if i != -1:
+            theme = renderer.card_back_themes[i]
+            renderer.selected_card_theme = theme
+            renderer.current_card_back_path = f"assets/cards/{theme}/back.png"
+            renderer.load_assets(renderer.current_background_path, renderer.current_card_back_path,
+                                 (CARD_WIDTH, CARD_HEIGHT))
+            return
 
-        # Cancel
-        cancel_rect = pygame.Rect(SCREEN_WIDTH // 2 + 40, SCREEN_HEIGHT - 100, 200, 60)
-        if cancel_rect.collidepoint(mouse_pos):
+        # Apply & Return, Cancel
+        if renderer.apply_rect.collidepoint(pos) or renderer.cancel_rect.collidepoint(pos):
             self.state_manager.state = "menu"
 
     def _handle_lobby_click(self, pos: Tuple[int, int]) -> None:
@@ -697,16 +944,6 @@ class EventHandler:
         refresh_btn = self.ui_elements["refresh"]
         disconnect_btn = self.ui_elements["disconnect"]
 
-        # Player count selector rects (match renderer positions) — y moved to 210
-        pc_base_x = 50
-        pc_y = 210
-        pc_width = 40
-        pc_height = 30
-
-        pc2_rect = pygame.Rect(pc_base_x, pc_y, pc_width, pc_height)
-        pc3_rect = pygame.Rect(pc_base_x + 50, pc_y, pc_width, pc_height)
-        pc4_rect = pygame.Rect(pc_base_x + 100, pc_y, pc_width, pc_height)
-
         if room_name_field.rect.collidepoint(pos):
             room_name_field.active = True
         elif create_btn.rect.collidepoint(pos):
@@ -720,21 +957,14 @@ class EventHandler:
         else:
             room_name_field.active = False
 
-        # Handle player-count selection clicks
-        if pc2_rect.collidepoint(pos):
-            self.selected_max_players = 2
-            self.renderer.selected_room_max_players = 2
-            return
-        if pc3_rect.collidepoint(pos):
-            self.selected_max_players = 3
-            self.renderer.selected_room_max_players = 3
-            return
-        if pc4_rect.collidepoint(pos):
-            self.selected_max_players = 4
-            self.renderer.selected_room_max_players = 4
-            return
+        # Handle player-count selection clicks; the rects are the ones the renderer draws
+        for val, rect in self.renderer.player_count_rects:
+            if rect.collidepoint(pos):
+                self.selected_max_players = val
+                self.renderer.selected_room_max_players = val
+                return
 
-        if pygame.Rect(300, 150, SCREEN_WIDTH - 350, SCREEN_HEIGHT - 200).collidepoint(pos):
+        if self.renderer.rooms_list_rect.collidepoint(pos):
             self._handle_room_list_click(pos)
 
     def _handle_room_list_click(self, pos: Tuple[int, int]) -> None:
@@ -752,21 +982,19 @@ class EventHandler:
             self.network.send_message({"t": "leave_room"})
 
     def _handle_game_click(self, pos: Tuple[int, int]) -> None:
-        leave_btn_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
-        if leave_btn_rect.collidepoint(pos):
+        if self.renderer.leave_rect.collidepoint(pos):
             self.network.send_message({"t": "leave_room"})
         elif self.state_manager.state == "playing" and self.state_manager.game_state and self.state_manager.local_player == self.state_manager.game_state.get(
                 "current_player", -1):
-            for i, sprite in enumerate(self.card_sprites[self.state_manager.local_player].sprites()):
-                if sprite.rect.collidepoint(pos):
-                    self.network.send_message({"t": "p", "ci": i})
-                    return
+            i = pygame.Rect(pos, (1, 1)).collidelist(self.renderer.local_hand_rects)
+            if i != -1:
+                self.network.send_message({"t": "p", "ci": i})
+                return
             if self.layout.draw_pile_rect.collidepoint(pos):
                 self.network.send_message({"t": "d"})
 
     def _handle_leaderboard_click(self, pos: Tuple[int, int]) -> None:
-        leave_btn_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
-        if leave_btn_rect.collidepoint(pos):
+        if self.renderer.leave_rect.collidepoint(pos):
             self.network.send_message({"t": "leave_room"})
 
     def handle_key(self, event) -> None:
@@ -805,7 +1033,7 @@ class EventHandler:
             self.state_manager.waiting_message = "Setting name..."
             running_flag = [True]
             self.network.start_listener(running_flag, self._on_network_message)
-            self.network.send_message({"t": "set_name", "name": self.player_name})
+            self.network.send_message({"t": "set_name", "name": self.player_name, "caps": LOCAL_CAPS})
         else:
             self.state_manager.waiting_message = f"Failed to connect to {ip}"
 
@@ -826,6 +1054,10 @@ class EventHandler:
         if msg_type == "lobby_welcome":
             # Server welcome only confirms connection; still wait for "name_set" to enter lobby.
             self.state_manager.waiting_message = None
+            try:
+                self.network.peer_caps = int(message.get("caps", 0)) & LOCAL_CAPS
+            except (TypeError, ValueError):
+                self.network.peer_caps = 0
 
         elif msg_type == "name_set":
             # Server accepted the username; now enter lobby.
@@ -843,8 +1075,10 @@ class EventHandler:
             self.current_room_id = message.get("room_id")
             self.current_room_name = message.get("room_name", "")
             self.state_manager.local_player = message.get("player_slot", 0)
-            self.state_manager.player_names[self.state_manager.local_player] = self.player_name
-            print(f"[DEBUG] Set local player {self.state_manager.local_player} name: {self.player_name}")
+            # Replace rather than mutate: the table may be the one _slot_names shares between game states.
+            self.state_manager.player_names = {**self.state_manager.player_names,
+                                               self.state_manager.local_player: self.player_name}
+            logger.debug("Set local player %s name: %s", self.state_manager.local_player, self.player_name)
             self.update_card_sprites()
             self.state_manager.state = "room_waiting"
             self.state_manager.waiting_message = f"Joined room: {self.current_room_name}"
@@ -854,8 +1088,8 @@ class EventHandler:
             player_slot = message.get("player_slot", -1)
             players_count = message.get("players_count", 1)
             if player_slot >= 0:
-                self.state_manager.player_names[player_slot] = player_name
-                print(f"[DEBUG] Set player {player_slot} name: {player_name}")
+                self.state_manager.player_names = {**self.state_manager.player_names, player_slot: player_name}
+                logger.debug("Set player %d name: %s", player_slot, player_name)
 
         elif msg_type == "player_left":
             player_name = message.get("player_name", "Unknown")
@@ -869,15 +1103,14 @@ class EventHandler:
 
 
         elif msg_type == "gs":
-            print("[DEBUG GS RECEIVED] player_names in message:", message.get("player_names", "MISSING_KEY"))
+            logger.debug("gs player_names=%s", message.get("player_names", "MISSING_KEY"))
             if "player_names" in message:
-                print("[DEBUG GS RECEIVED] player_names dict:", message["player_names"])
-                player_names_converted = {int(k): v for k, v in message["player_names"].items()}
+                player_names_converted = self._slot_names(message["player_names"])
                 self.state_manager.player_names = player_names_converted
                 message["player_names"] = player_names_converted
 
             self.state_manager.num_players = message.get("num_players", len(message.get("players", [])))
-            print(f"[DEBUG] Set num_players to {self.state_manager.num_players}")
+            logger.debug("Set num_players to %d", self.state_manager.num_players)
             self.state_manager.game_state = message
             self.state_manager.waiting_message = None
             self.state_manager.state = "playing"
@@ -887,13 +1120,16 @@ class EventHandler:
         elif msg_type == "go":
             self.state_manager.waiting_message = f"Game over! Winner: Player {message.get('w', 'none')}"
             if "player_names" in message:
-                converted = {int(k): v for k, v in message["player_names"].items()}
+                converted = self._slot_names(message["player_names"])
                 self.state_manager.player_names = converted
             self.state_manager.state = "leaderboard"
             self.state_manager.leaderboard_data = message.get("results", [])
             self.state_manager.leaderboard_start = time.time()
             self.state_manager.game_state = None
-            self.card_sprites = {i: pygame.sprite.Group() for i in range(4)}
+            self.card_sprites = []
+            self._hand_signature = None
+            self.renderer.card_blits = []
+            self.renderer.local_hand_rects = []
             self.current_room_id = None
             self.current_room_name = ""
 
@@ -909,44 +1145,63 @@ class EventHandler:
             # Server error (e.g., duplicate name). Stay out of lobby and show error.
             self.state_manager.waiting_message = f"Error: {message.get('msg', 'Unknown error')}"
 
+    def _slot_names(self, raw: Dict) -> Dict[int, str]:
+        """Slot -> name table with int keys; JSON stringifies them while msgpack keeps them as ints."""
+        # Every game state repeats the same table, so the keys are only converted when it changes.
+        cached_raw, names = self._slot_names_cache
+        if raw != cached_raw:
+            names = dict(raw) if all(isinstance(k, int) for k in raw) else {int(k): v for k, v in raw.items()}
+            self._slot_names_cache = (raw, names)
+        # The table is shared between messages; callers replace it rather than mutate it.
+        return names
+
     def update_card_sprites(self) -> None:
         if not self.state_manager.game_state or self.state_manager.local_player is None:
             return
 
         num_players = self.state_manager.num_players
+        local_player = self.state_manager.local_player
+        hands = self.state_manager.game_state.get("players", [])
 
-        # Force-clear ALL sprite groups every time we get a new game state
-        # This is the safest way — prevents any stale data from previous games
-        for i in range(num_players):
-            self.card_sprites[i].empty()
-
-        # Now rebuild everything fresh
+        # Most game states only move the turn or the discard pile; leave the sprites alone then.
+        seating = (num_players, local_player)
+        names = tuple(tuple(card_data["name"] for card_data in hand) for hand in hands)
+        if (seating, names) == self._hand_signature:
+            return
+        old_seating, old_names = self._hand_signature or (None, ())
+        self._hand_signature = (seating, names)
+        if seating != old_seating:
+            self.card_sprites = [[] for _ in range(num_players)]
+            old_names = ()
+
+        # Only hands that changed are laid out again, reusing their existing sprites where possible
+        back = self.renderer.get_card("back", 0, "")
         for i in range(num_players):
-            hand = self.state_manager.game_state.get("players", [])[i]
+            if i < len(old_names) and old_names[i] == names[i]:
+                continue
+            hand = hands[i]
+            sprites = self.card_sprites[i]
+            del sprites[len(hand):]
             if not hand:
                 continue
 
-            pos_index = (i - self.state_manager.local_player) % num_players
-            is_local = (i == self.state_manager.local_player)
-
-            for j, card_data in enumerate(hand):
-                card_key = card_data["name"]
-                if card_key not in self.card_cache:
-                    self.card_cache[card_key] = Card(
-                        card_data["name"],
-                        card_data["value"],
-                        card_data["suit"]
-                    )
-                card = self.card_cache[card_key]
-
-                x, y, angle = self.layout.get_player_position(
-                    pos_index, len(hand), j, is_local=is_local
-                )
+            pos_index = (i - local_player) % num_players
+            is_local = (i == local_player)
 
+            positions = self.layout.layout_hand(pos_index, len(hand), is_local=is_local)
+            for j, (card_data, (x, y, angle)) in enumerate(zip(hand, positions)):
                 # Use real card for yourself, back for others
-                display_card = card if is_local else self.card_cache.get("back", Card("back", 0, ""))
-                sprite = CardSprite(display_card, x, y, angle)
-                self.card_sprites[i].add(sprite)
+                if is_local:
+                    display_card = self.renderer.get_card(card_data["name"], card_data["value"], card_data["suit"])
+                else:
+                    display_card = back
+                if j < len(sprites):
+                    sprites[j].set_card(display_card, x, y, angle)
+                else:
+                    sprites.append(CardSprite(display_card, x, y, angle))
+
+        self.renderer.card_blits = [(sprite.image, sprite.rect) for hand in self.card_sprites for sprite in hand]
+        self.renderer.local_hand_rects = [sprite.rect for sprite in self.card_sprites[local_player]]
 
 class MultiRoomClient:
     def __init__(self):
@@ -1018,7 +1273,7 @@ class MultiRoomClient:
         self.leave_room_button_rect = pygame.Rect(50, SCREEN_HEIGHT - 60, 150, 40)
 
     def _reset_render_game(self):
-        self.card_sprites = {i: pygame.sprite.Group() for i in range(4)}
+        self.card_sprites = []
         self.card_rects = []
         self.card_cache = {}
         self.state_manager.render_debug_done = False
@@ -1027,7 +1282,14 @@ class MultiRoomClient:
         clock = pygame.time.Clock()
 
         while self.running:
-            for event in pygame.event.get():
+            mouse_moved = False
+            events = pygame.event.get()
+            active = bool(events)
+            for event in events:
+                if event.type == pygame.MOUSEMOTION:
+                    mouse_moved = True
+                    continue
+                self.renderer.invalidate()
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1036,8 +1298,10 @@ class MultiRoomClient:
                 elif event.type == pygame.KEYDOWN:
                     self.event_handler.handle_key(event)
 
-            while not self.network.message_queue.empty():
-                self.event_handler._on_network_message(self.network.message_queue.get())
+            for message in self.network.get_messages():
+                self.event_handler._on_network_message(message)
+                self.renderer.invalidate()
+                active = True
 
             if self.state_manager.state == "leaderboard" and time.time() - self.state_manager.leaderboard_start > LEADERBOARD_DURATION:
                 self.network.send_message({"t": "leave_room"})
@@ -1046,53 +1310,81 @@ class MultiRoomClient:
                 self.event_handler.current_room_name = ""
                 self.state_manager.leaderboard_data = None
                 self.state_manager.game_state = None
+                self.renderer.invalidate()
+
+            self.network.flush()
+            if self.renderer.consume_dirty():
+                self.renderer.present(self._draw_frame, self._hover_rects())
+            elif mouse_moved:
+                # Only hover highlights follow the mouse, so repaint just the widgets that gained or lost it.
+                self.renderer.repaint_hover(self._draw_frame, self._hover_rects())
 
-            mouse_pos = pygame.mouse.get_pos()
-
-            if self.state_manager.state == "menu":
-                self.renderer.render_menu(
-                    self.input_fields["ip"],
-                    self.input_fields["name"],
-                    self.ui_elements["connect"],
-                    self.ui_elements["close"],
-                    self.state_manager.waiting_message
-                )
-                self.ui_elements["customize"].draw(self.screen, mouse_pos)
-
-            elif self.state_manager.state == "lobby":
-                self.card_sprites: Dict[int, pygame.sprite.Group] = self.event_handler.card_sprites
-                self.renderer.render_lobby(
-                    self.renderer.current_background_path,
-                    self.event_handler.player_name,
-                    self.input_fields["room_name"],
-                    self.ui_elements["create"],
-                    self.ui_elements["refresh"],
-                    self.ui_elements["disconnect"],
-                    self.event_handler.rooms_list,
-                    self.state_manager.waiting_message
-                )
-
-            elif self.state_manager.state in ["room_waiting", "playing"]:
-
-                self.renderer.render_game(
-                    self.state_manager,
-                    self.card_sprites,
-                    self.event_handler.current_room_name,
-                    mouse_pos,
-                    self.state_manager.waiting_message
-                )
-
-            elif self.state_manager.state == "leaderboard":
-                self.renderer.render_leaderboard(self.state_manager, mouse_pos)
-
-            elif self.state_manager.state == "customize":
-                self.renderer.render_customize(mouse_pos)
-
-            pygame.display.flip()
-            clock.tick(60)
+            if self.state_manager.state == "playing":
+                clock.tick(GAME_FPS)
+            else:
+                clock.tick(MENU_FPS if active else IDLE_FPS)
 
         self._cleanup()
 
+    def _hover_rects(self) -> List[pygame.Rect]:
+        """Every rect whose look depends on the mouse in the current state."""
+        state = self.state_manager.state
+        renderer = self.renderer
+        if state == "menu":
+            return [self.ui_elements[name].rect for name in ("connect", "close", "customize")]
+        if state == "customize":
+            return renderer.background_option_rects + renderer.card_theme_rects + [renderer.apply_rect, renderer.cancel_rect]
+        if state == "lobby":
+            return ([self.ui_elements[name].rect for name in ("create", "refresh", "disconnect")]
+                    + [rect for _, rect in renderer.player_count_rects]
+                    + renderer._room_rects[:len(self.event_handler.rooms_list)])
+        if state == "playing":
+            return [renderer.leave_rect, self.layout.draw_pile_rect] + renderer.local_hand_rects
+        if state in ("room_waiting", "leaderboard"):
+            return [renderer.leave_rect]
+        return []
+
+    def _draw_frame(self) -> None:
+        mouse_pos = pygame.mouse.get_pos()
+
+        if self.state_manager.state == "menu":
+            self.renderer.render_menu(
+                self.input_fields["ip"],
+                self.input_fields["name"],
+                self.ui_elements["connect"],
+                self.ui_elements["close"],
+                self.state_manager.waiting_message
+            )
+            self.ui_elements["customize"].draw(self.screen, mouse_pos)
+
+        elif self.state_manager.state == "lobby":
+            self.renderer.render_lobby(
+                self.renderer.current_background_path,
+                self.event_handler.player_name,
+                self.input_fields["room_name"],
+                self.ui_elements["create"],
+                self.ui_elements["refresh"],
+                self.ui_elements["disconnect"],
+                self.event_handler.rooms_list,
+                self.state_manager.waiting_message
+            )
+
+        elif self.state_manager.state in ["room_waiting", "playing"]:
+
+            self.renderer.render_game(
+                self.state_manager,
+                self.event_handler.card_sprites,
+                self.event_handler.current_room_name,
+                mouse_pos,
+                self.state_manager.waiting_message
+            )
+
+        elif self.state_manager.state == "leaderboard":
+            self.renderer.render_leaderboard(self.state_manager, mouse_pos)
+
+        elif self.state_manager.state == "customize":
+            self.renderer.render_customize(mouse_pos)
+
     def _cleanup(self) -> None:
         self.network.disconnect()
         pygame.quit()
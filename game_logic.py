@@ -1,31 +1,42 @@
+import json
 import random
 import logging
 from collections import deque
-from typing import List, Dict
-from card import Card
+from typing import List
 
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+# A card is a small int: suit index in the high nibble, value (7-14) in the low nibble.
+SUITS = ("♥", "♦", "♣", "♠")
+VALUES = range(7, 15)
+DECK = tuple((suit << 4) | value for suit in range(len(SUITS)) for value in VALUES)
+CARD_NAMES = {card: f"{card & 0xF}{SUITS[card >> 4]}" for card in DECK}
+# Bitmask of the card ids that may be played on each top discard: same suit, same value, or any queen (12).
+LEGAL_MOVES = {top: sum(1 << card for card in DECK
+                        if card >> 4 == top >> 4 or card & 0xF == top & 0xF or card & 0xF == 12)
+               for top in DECK}
+# Wire form of every card, built once and shared by every serialize(); treat as read-only.
+CARD_DICTS = {card: {"name": CARD_NAMES[card], "value": card & 0xF, "suit": SUITS[card >> 4]} for card in DECK}
+# Text every serialized game state is made of (keys plus every card); client and server build their zstd
+# dictionary for "gs" frames from these exact bytes, so changing them changes the wire format.
+GS_DICTIONARY_SAMPLE = json.dumps(
+    {"t": "gs", "num_players": 4, "players": [list(CARD_DICTS.values())], "draw_pile_count": 0,
+     "discard_pile": [], "current_player": 0, "player_names": {}},
+    ensure_ascii=False, separators=(',', ':')).encode()
+
 class Game:
     def __init__(self, num_players: int = 4):
         self.num_players = max(2, int(num_players))  # ensure minimum of 2
-        self.players: List[List[Card]] = [[] for _ in range(self.num_players)]
-        self.draw_pile: deque[Card] = deque()
-        self.discard_pile: deque[Card] = deque()
+        self.players: List[List[int]] = [[] for _ in range(self.num_players)]
+        self.draw_pile: deque[int] = deque()
+        self.discard_pile: deque[int] = deque()
         self.current_player: int = 0
-        self._card_cache: Dict[str, Card] = {}
 
     def create_deck(self) -> None:
-        suits = ["♥", "♦", "♣", "♠"]
-        values = list(range(7, 15))
-        for suit in suits:
-            for value in values:
-                card_key = f"{value}{suit}"
-                if card_key not in self._card_cache:
-                    self._card_cache[card_key] = Card(card_key, value, suit)
-        self.draw_pile = deque(list(self._card_cache.values()))
-        random.shuffle(self.draw_pile)
+        cards = list(DECK)
+        random.shuffle(cards)
+        self.draw_pile = deque(cards)
 
     def deal_cards(self) -> None:
         for _ in range(5):
@@ -36,36 +47,42 @@ class Game:
             self.discard_pile.append(self.draw_pile.popleft())
 
     def play_card(self, player_index: int, card_index: int) -> bool:
-        if not (0 <= player_index < self.num_players and 0 <= card_index < len(self.players[player_index])):
+        players = self.players
+        if not (0 <= player_index < self.num_players and 0 <= card_index < len(players[player_index])):
             logger.error(f"Invalid player {player_index} or card index {card_index}")
             return False
 
-        card = self.players[player_index][card_index]
-        top_discard = self.discard_pile[-1] if self.discard_pile else None
+        hand = players[player_index]
+        card = hand[card_index]
+        value = card & 0xF
+        discard_pile = self.discard_pile
+        top_discard = discard_pile[-1] if discard_pile else None
 
-        if top_discard and not (card.suit == top_discard.suit or card.value == top_discard.value or card.value == 12):
-            logger.error(f"Cannot play {card}: must match {top_discard.suit} or {top_discard.value}")
+        if top_discard is not None and not LEGAL_MOVES[top_discard] >> card & 1:
+            logger.error(f"Cannot play {CARD_NAMES[card]}: must match {SUITS[top_discard >> 4]} or {top_discard & 0xF}")
             return False
 
-        self.discard_pile.append(self.players[player_index].pop(card_index))
+        discard_pile.append(hand.pop(card_index))
 
-        if card.value == 7:
+        if value == 7:
             next_player = self._get_next_active_player()
+            next_hand = players[next_player]
             cards_drawn = 0
             for _ in range(3):
+                # _refresh_draw_pile rebinds both piles, so they are re-read from self here.
                 if not self.draw_pile:
                     self._refresh_draw_pile()
                 if self.draw_pile:
-                    self.players[next_player].append(self.draw_pile.popleft())
+                    next_hand.append(self.draw_pile.popleft())
                     cards_drawn += 1
                 else:
                     logger.error(f"Cannot draw card {cards_drawn + 1} for Player {next_player + 1}: draw pile empty")
                     break
             self.current_player = next_player
-        elif card.value == 14:
+        elif value == 14:
             self.current_player = self._get_next_active_player()
 
-        if not self.draw_pile and card.value != 7:
+        if not self.draw_pile and value != 7:
             self._refresh_draw_pile()
 
         self.next_turn()
@@ -77,8 +94,9 @@ class Game:
             return False
         if not self.draw_pile:
             self._refresh_draw_pile()
-        if self.draw_pile:
-            self.players[player_index].append(self.draw_pile.popleft())
+        draw_pile = self.draw_pile
+        if draw_pile:
+            self.players[player_index].append(draw_pile.popleft())
             return True
         logger.error("Draw pile is empty")
         return False
@@ -87,34 +105,40 @@ class Game:
         if len(self.discard_pile) <= 1:
             logger.error("Not enough default to refresh draw pile")
             return
-        top_card = self.discard_pile[-1]
-        cards_to_shuffle = list(self.discard_pile)[:-1]
+        top_card = self.discard_pile.pop()
+        cards_to_shuffle = list(self.discard_pile)
         random.shuffle(cards_to_shuffle)
         self.draw_pile = deque(cards_to_shuffle)
-        self.discard_pile = deque([top_card])
+        self.discard_pile = deque((top_card,))
 
     def _get_next_active_player(self) -> int:
-        next_player = (self.current_player + 1) % self.num_players
-        for _ in range(self.num_players):
-            if self.players[next_player]:
+        num_players = self.num_players
+        players = self.players
+        next_player = (self.current_player + 1) % num_players
+        for _ in range(num_players):
+            if players[next_player]:
                 return next_player
-            next_player = (next_player + 1) % self.num_players
+            next_player = (next_player + 1) % num_players
         return next_player
 
     def next_turn(self) -> None:
         self.current_player = self._get_next_active_player()
 
     def check_game_over(self) -> bool:
-        return sum(1 for player in self.players if player) <= 1
+        # Stop as soon as a second player still holding cards turns up.
+        active = 0
+        for player in self.players:
+            if player:
+                active += 1
+                if active > 1:
+                    return False
+        return True
 
     def serialize(self) -> dict:
         return {
             "num_players": self.num_players,                    # ← added
-            "players": [[{"name": card.name, "value": card.value, "suit": card.suit}
-                         for card in hand]
-                        for hand in self.players],
+            "players": [[CARD_DICTS[card] for card in hand] for hand in self.players],
             "draw_pile_count": len(self.draw_pile),
-            "discard_pile": [{"name": card.name, "value": card.value, "suit": card.suit}
-                             for card in self.discard_pile],
+            "discard_pile": [CARD_DICTS[card] for card in self.discard_pile],
             "current_player": self.current_player
         }
\ No newline at end of file
@@ -4,24 +4,69 @@ import json
 import struct
 import signal
 import sys
-import time
 import os
 import argparse
 import zlib
 import uuid
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
-from game_logic import Game
+from game_logic import Game, GS_DICTIONARY_SAMPLE
 import logging
 from datetime import datetime
 
-logging.basicConfig(level=logging.ERROR)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# Timestamps come from the formatter; force replaces the ERROR-only config game_logic installs on import.
+logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s',
+                    datefmt='%Y-%m-%d %H:%M:%S', force=True)
 logger = logging.getLogger(__name__)
 
 DEFAULT_PORT = 65432
 HOST = '0.0.0.0'
 MAX_ROOMS = 5
 MAX_PLAYERS_PER_ROOM = 4
+# Frame header is !IB: payload length, then flags describing the payload.
+FRAME_HEADER = struct.Struct('!IB')
+FRAME_ZLIB = 0x01
+FRAME_MSGPACK = 0x02
+COMPRESS_MIN_SIZE = 4096
+# Hot in-game requests skip the generic codec and travel as a two-byte opcode frame (opcode, card index).
+FRAME_OPCODE = 0x04
+OPCODE_FRAME = struct.Struct('!BB')
+FRAME_HEADER_PLACEHOLDER = bytes(FRAME_HEADER.size)
+FAST_OPCODES = {"p": 1, "d": 2, "leave_room": 3, "refresh_rooms": 4}
+FAST_MESSAGES = {opcode: t for t, opcode in FAST_OPCODES.items()}
+RECV_BUFFER_SIZE = 16384
+# A client that lets this much output pile up unread is dropped rather than buffered without bound.
+MAX_TX_BACKLOG = 1 << 20
+# Housekeeping is driven by RoomManager.dirty, so select() only needs a timeout for Ctrl+C to be noticed on Windows.
+IDLE_SELECT_TIMEOUT = 1.0
+# Large payloads use zstd level 1 towards peers that advertise it, zlib otherwise; both are accepted on receive.
+FRAME_ZSTD = 0x08
+ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=1) if zstd else None
+ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor() if zstd else None
+# Game states are compressed at any size against a shared dictionary of their keys and card dicts,
+# for peers whose caps include FRAME_ZSTD_DICT.
+FRAME_ZSTD_DICT = 0x10
+ZSTD_GS_DICT = zstd.ZstdCompressionDict(GS_DICTIONARY_SAMPLE, dict_type=zstd.DICT_TYPE_RAWCONTENT) if zstd else None
+ZSTD_GS_COMPRESSOR = zstd.ZstdCompressor(level=1, dict_data=ZSTD_GS_DICT) if zstd else None
+ZSTD_GS_DECOMPRESSOR = zstd.ZstdDecompressor(dict_data=ZSTD_GS_DICT) if zstd else None
+# Optional codecs are only used towards a peer that advertised them: each side sends the frame flags it can
+# decode as "caps" (client in set_name, server in lobby_welcome). JSON with zlib is what every peer understands.
+LOCAL_CAPS = (FRAME_MSGPACK if msgpack else 0) | (FRAME_ZSTD | FRAME_ZSTD_DICT if zstd else 0)
 
 
 def get_local_ip() -> str:
@@ -36,14 +81,85 @@ def get_local_ip() -> str:
         return "Unknown"
 
 
+def encode_payload(message: dict, caps: int = 0) -> Tuple[int, bytes]:
+    """Serialize (and compress if large) a message for a peer accepting caps; returns the flags and payload."""
+    if caps & FRAME_MSGPACK:
+        data, flags = msgpack.packb(message, use_bin_type=True), FRAME_MSGPACK
+    elif orjson:
+        # player_names is keyed by int slot, which plain orjson refuses.
+        data, flags = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS), 0
+    else:
+        data, flags = json.dumps(message, separators=(',', ':')).encode(), 0
+    if caps & FRAME_ZSTD_DICT and message.get("t") == "gs":
+        data, flags = ZSTD_GS_COMPRESSOR.compress(data), flags | FRAME_ZSTD_DICT
+    elif len(data) >= COMPRESS_MIN_SIZE:
+        if caps & FRAME_ZSTD:
+            data, flags = ZSTD_COMPRESSOR.compress(data), flags | FRAME_ZSTD
+        else:
+            data, flags = zlib.compress(data, 1), flags | FRAME_ZLIB
+    return flags, data
+
+
+def encode_frame(message: dict, caps: int = 0) -> bytes:
+    flags, data = encode_payload(message, caps)
+    return FRAME_HEADER.pack(len(data), flags) + data
+
+
+def frame_encoder(message: dict) -> Callable[[int], bytes]:
+    """Return caps -> frame for a broadcast, encoding the message once per distinct set of peer caps."""
+    frames: Dict[int, bytes] = {}
+
+    def frame_for(caps: int) -> bytes:
+        framed = frames.get(caps)
+        if framed is None:
+            framed = frames[caps] = encode_frame(message, caps)
+        return framed
+
+    return frame_for
+
+
+def decode_frame(flags: int, payload: bytes) -> dict:
+    if flags & FRAME_OPCODE:
+        opcode, card_index = OPCODE_FRAME.unpack(payload)
+        if opcode not in FAST_MESSAGES:
+            raise ValueError(f"Unknown opcode {opcode}")
+        message = {"t": FAST_MESSAGES[opcode]}
+        if opcode == FAST_OPCODES["p"]:
+            message["ci"] = card_index
+        return message
+    if flags & (FRAME_ZSTD | FRAME_ZSTD_DICT):
+        if zstd is None:
+            raise ValueError("zstd frame received but zstandard is not installed")
+        decompressor = ZSTD_GS_DECOMPRESSOR if flags & FRAME_ZSTD_DICT else ZSTD_DECOMPRESSOR
+        try:
+            payload = decompressor.decompress(payload)
+        except zstd.ZstdError as e:
+            raise ValueError(f"Corrupt zstd frame: {e}") from e
+    elif flags & FRAME_ZLIB:
+        payload = zlib.decompress(payload)
+    if flags & FRAME_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack frame received but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if orjson:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 @dataclass
 class Player:
+    __slots__ = ("sock", "name", "slot")
+
     sock: socket.socket
     name: str
     slot: int
 
 
 class GameRoom:
+    __slots__ = ("room_id", "room_name", "creator", "max_players", "game", "game_ended", "players", "player_names",
+                 "sockets", "sock_to_slot", "active_count", "finish_order", "disconnected", "last_game_state",
+                 "created_at", "_info_fields")
+
     def __init__(self, room_id: str, room_name: str, creator: Player, max_players: int = MAX_PLAYERS_PER_ROOM):
         self.room_id = room_id
         self.room_name = room_name
@@ -54,10 +170,20 @@ class GameRoom:
         self.players: List[Optional[Player]] = [None] * self.max_players
         self.player_names: Dict[int, str] = {}
         self.sockets: Set[socket.socket] = set()
+        self.sock_to_slot: Dict[socket.socket, int] = {}
+        self.active_count: int = 0  # Occupied seats, kept in step by _add_player/remove_player
         self.finish_order: List[int] = []
         self.disconnected: Set[int] = set()
         self.last_game_state: Optional[dict] = None
         self.created_at = datetime.now()
+        # The room_list entry fields that never change after creation, formatted once.
+        self._info_fields = {
+            "room_id": room_id,
+            "room_name": room_name,
+            "creator": creator.name,
+            "max_players": max_players,
+            "created_at": self.created_at.strftime('%H:%M:%S')
+        }
 
         self._add_player(creator)
 
@@ -68,34 +194,39 @@ class GameRoom:
         self.players[slot] = player
         self.player_names[slot] = player.name
         self.sockets.add(player.sock)
+        self.sock_to_slot[player.sock] = slot
+        self.active_count += 1
         return True
 
     def remove_player(self, sock: socket.socket) -> bool:
-        for i, player in enumerate(self.players):
-            if player and player.sock == sock:
-                if self.game and self.game.players[i]:
-                    print(
-                        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Moving Player {i + 1}'s {len(self.game.players[i])} cards to discard pile in room {self.room_name}")
-                    self.game.discard_pile.extendleft(self.game.players[i])
-                    self.game.players[i].clear()
-                    self.disconnected.add(i)
-
-                    if self.game.current_player == i:
-                        self.game.next_turn()
-
-                self.players[i] = None
-                self.sockets.discard(sock)
-                return True
-        return False
+        i = self.sock_to_slot.pop(sock, None)
+        if i is None:
+            return False
+        game = self.game
+        if game and game.players[i]:
+            hand = game.players[i]
+            logger.info(f"Moving Player {i + 1}'s {len(hand)} cards to discard pile in room {self.room_name}")
+            # Hand the old list to the discard pile and seat an empty one, rather than clearing it in place.
+            game.players[i] = []
+            game.discard_pile.extendleft(hand)
+            self.disconnected.add(i)
+
+            if game.current_player == i:
+                game.next_turn()
+
+        self.players[i] = None
+        self.sockets.discard(sock)
+        self.active_count -= 1
+        return True
 
     def is_empty(self) -> bool:
-        return all(p is None for p in self.players)
+        return self.active_count == 0
 
     def is_full(self) -> bool:
-        return all(p is not None for p in self.players)
+        return self.active_count == self.max_players
 
     def can_start_game(self) -> bool:
-        return len([p for p in self.players if p]) == self.max_players and self.game is None and not self.game_ended
+        return self.active_count == self.max_players and self.game is None and not self.game_ended
 
     def start_game(self):
         if self.can_start_game():
@@ -105,21 +236,15 @@ class GameRoom:
             self.game.deal_cards()
             self.finish_order = []
             self.disconnected = set()
-            print(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Game started in room '{self.room_name}' with {len([p for p in self.players if p])} players")
+            logger.info(f"Game started in room '{self.room_name}' with {self.active_count} players")
             return True
         return False
 
     def get_room_info(self) -> dict:
-        return {
-            "room_id": self.room_id,
-            "room_name": self.room_name,
-            "creator": self.creator.name,
-            "players": len([p for p in self.players if p]),
-            "max_players": self.max_players,
-            "in_game": self.game is not None or self.game_ended,
-            "created_at": self.created_at.strftime('%H:%M:%S')
-        }
+        info = self._info_fields.copy()
+        info["players"] = self.active_count
+        info["in_game"] = self.game is not None or self.game_ended
+        return info
 
 
 class LobbyManager:
@@ -142,24 +267,30 @@ class LobbyManager:
     def broadcast(self, message: dict, exclude_sock: Optional[socket.socket] = None, server: 'MultiRoomServer' = None):
         if server is None:
             return
+        self.broadcast_frames(frame_encoder(message), exclude_sock, server)
+
+    def broadcast_frames(self, frame_for: Callable[[int], bytes], exclude_sock: Optional[socket.socket] = None,
+                         server: 'MultiRoomServer' = None):
+        if server is None:
+            return
+        client_caps = server.client_caps
         failed_sockets = []
         for sock in list(self.clients):
             if sock != exclude_sock:
-                if not server.send_message(sock, message):
+                if not server.send_raw(sock, frame_for(client_caps.get(sock, 0))):
                     failed_sockets.append(sock)
         for sock in failed_sockets:
             self.remove_client(sock)
             server._remove_client(sock)
 
-    def send_room_list(self, sock: socket.socket, rooms: Dict[str, GameRoom], server: 'MultiRoomServer'):
+    def send_room_list(self, sock: socket.socket, rooms: 'RoomManager', server: 'MultiRoomServer'):
         if server is None:
             return
-        rooms_info = [room.get_room_info() for room in rooms.values() if not room.game and not room.game_ended]
         server.send_message(sock, {
             "t": "room_list",
-            "rooms": rooms_info,
+            "rooms": rooms.get_available_rooms_info(),
             "max_rooms": MAX_ROOMS,
-            "current_rooms": len(rooms)
+            "current_rooms": len(rooms.rooms)
         })
 
 
@@ -167,6 +298,14 @@ class RoomManager:
     def __init__(self):
         self.rooms: Dict[str, GameRoom] = {}
         self.client_rooms: Dict[socket.socket, str] = {}
+        self.dirty: Set[str] = set()  # Rooms whose game changed since the last housekeeping pass
+        # Joinable-room list and its room_list_update frame per peer caps, rebuilt lazily after invalidate_room_list().
+        self._available_rooms: Optional[List[dict]] = None
+        self._room_list_frames: Dict[int, bytes] = {}
+
+    def invalidate_room_list(self) -> None:
+        self._available_rooms = None
+        self._room_list_frames.clear()
 
     def create_room(self, sock: socket.socket, room_name: str, creator_name: str, max_players: int = MAX_PLAYERS_PER_ROOM) -> Optional[str]:
         if len(self.rooms) >= MAX_ROOMS:
@@ -178,6 +317,7 @@ class RoomManager:
         room = GameRoom(room_id, room_name, creator, max_players)
         self.rooms[room_id] = room
         self.client_rooms[sock] = room_id
+        self.invalidate_room_list()
         return room_id
 
     def join_room(self, sock: socket.socket, room_id: str, player_name: str) -> Optional[int]:
@@ -189,11 +329,9 @@ class RoomManager:
         slot = next((i for i, p in enumerate(room.players) if p is None), None)
         if slot is None:
             return None
-        player = Player(sock, player_name, slot)
-        room.players[slot] = player
-        room.player_names[slot] = player_name
-        room.sockets.add(sock)
+        room._add_player(Player(sock, player_name, slot))
         self.client_rooms[sock] = room_id
+        self.invalidate_room_list()
         return slot
 
     def leave_room(self, sock: socket.socket, server: 'MultiRoomServer', lobby: LobbyManager) -> None:
@@ -203,13 +341,15 @@ class RoomManager:
                 room = self.rooms[room_id]
                 player_name = server.client_names.get(sock, "Unknown")
                 room.remove_player(sock)
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {player_name} left room '{room.room_name}'")
+                self.dirty.add(room_id)
+                self.invalidate_room_list()
+                logger.info(f"{player_name} left room '{room.room_name}'")
 
                 # Broadcast player_left to everyone in the room (including the leaving player)
                 self.broadcast_to_room(room_id, {
                     "t": "player_left",
                     "player_name": player_name,
-                    "players_count": len([p for p in room.players if p])
+                    "players_count": room.active_count
                 }, exclude_sock=None, server=server)
 
                 if room.game:
@@ -224,34 +364,47 @@ class RoomManager:
                     except Exception:
                         pass
 
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Closing empty room: {room.room_name}")
+                    logger.info(f"Closing empty room: {room.room_name}")
                     del self.rooms[room_id]
 
             self.client_rooms.pop(sock, None)
 
         lobby.add_client(sock)
         server.send_message(sock, {"t": "back_to_lobby"})
-        lobby.send_room_list(sock, self.rooms, server)
-        lobby.broadcast(
-            {"t": "room_list_update", "rooms": [r.get_room_info() for r in self.rooms.values() if not r.game and not r.game_ended]},
-            server=server)
+        lobby.send_room_list(sock, self, server)
+        lobby.broadcast_frames(self.room_list_update_frame, server=server)
 
     def broadcast_to_room(self, room_id: str, message: dict, exclude_sock: Optional[socket.socket] = None,
                           server: 'MultiRoomServer' = None):
         if room_id not in self.rooms or server is None:
             return
         room = self.rooms[room_id]
+        frame_for = frame_encoder(message)
+        client_caps = server.client_caps
         failed_sockets = []
         for sock in list(room.sockets):
             if sock != exclude_sock:
-                if not server.send_message(sock, message):
+                if not server.send_raw(sock, frame_for(client_caps.get(sock, 0))):
                     failed_sockets.append(sock)
         for sock in failed_sockets:
             room.remove_player(sock)
             self.client_rooms.pop(sock, None)
+            self.dirty.add(room_id)
+        if failed_sockets:
+            self.invalidate_room_list()
 
     def get_available_rooms_info(self) -> List[dict]:
-        return [room.get_room_info() for room in self.rooms.values() if not room.game and not room.game_ended]
+        if self._available_rooms is None:
+            self._available_rooms = [room.get_room_info() for room in self.rooms.values()
+                                     if not room.game and not room.game_ended]
+        return self._available_rooms
+
+    def room_list_update_frame(self, caps: int = 0) -> bytes:
+        framed = self._room_list_frames.get(caps)
+        if framed is None:
+            framed = self._room_list_frames[caps] = encode_frame(
+                {"t": "room_list_update", "rooms": self.get_available_rooms_info()}, caps)
+        return framed
 
     def end_game(self, room_id: str, server: 'MultiRoomServer', lobby: LobbyManager) -> None:
         if room_id not in self.rooms:
@@ -273,8 +426,7 @@ class RoomManager:
             results.append({"pid": pid, "rank": len(results) + 1, "cards_left": cards_left,
                             "disconnected": pid in room.disconnected})
 
-        print(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Game over in room '{room.room_name}', winner: Player {winner + 1 if winner is not None else 'none'}")
+        logger.info(f"Game over in room '{room.room_name}', winner: Player {winner + 1 if winner is not None else 'none'}")
 
         self.broadcast_to_room(room_id, {
             "t": "go",
@@ -285,6 +437,7 @@ class RoomManager:
 
         room.game = None
         room.game_ended = True
+        self.invalidate_room_list()
         room.last_game_state = None
         room.finish_order = []
 
@@ -294,174 +447,187 @@ class MessageHandler:
         self.lobby = lobby
         self.rooms = rooms
         self.server = server
+        # One dict lookup per message instead of walking an if/elif chain on the type.
+        self._lobby_handlers = {
+            "set_name": self._on_set_name,
+            "create_room": self._on_create_room,
+            "join_room": self._on_join_room,
+            "refresh_rooms": self._on_refresh_rooms,
+        }
+        self._room_handlers = {
+            "leave_room": self._on_leave_room,
+            "p": self._on_play_card,
+            "d": self._on_draw_card,
+        }
 
     def handle_lobby_message(self, sock: socket.socket, message: dict) -> None:
-        msg_type = message.get("t")
-
-        if msg_type == "set_name":
-            player_name = message.get("name", "").strip()
-            if not (3 <= len(player_name) <= 20):
-                self.server.send_message(sock, {"t": "e", "msg": "Name must be 3-20 characters long"})
-                return
+        handler = self._lobby_handlers.get(message.get("t"))
+        if handler is not None:
+            handler(sock, message)
 
-            if player_name in self.server.client_names.values():
-                self.server.send_message(sock, {"t": "e", "msg": "Name already taken"})
-                return
-
-            self.server.client_names[sock] = player_name
-            self.server.send_message(sock, {"t": "name_set", "name": player_name})
-            self.lobby.send_room_list(sock, self.rooms.rooms, self.server)
-
-
-        elif msg_type == "create_room":
+    def _on_set_name(self, sock: socket.socket, message: dict) -> None:
+        try:
+            caps = int(message.get("caps", 0))
+        except (TypeError, ValueError):
+            caps = 0
+        self.server.client_caps[sock] = caps & LOCAL_CAPS
+
+        player_name = message.get("name", "").strip()
+        if not (3 <= len(player_name) <= 20):
+            self.server.send_message(sock, {"t": "e", "msg": "Name must be 3-20 characters long"})
+            return
 
-            if sock not in self.server.client_names:
-                self.server.send_message(sock, {"t": "e", "msg": "Please set your name first"})
+        if player_name in self.server.client_names.values():
+            self.server.send_message(sock, {"t": "e", "msg": "Name already taken"})
+            return
 
-                return
+        self.server.client_names[sock] = player_name
+        self.server.send_message(sock, {"t": "name_set", "name": player_name})
+        self.lobby.send_room_list(sock, self.rooms, self.server)
 
-            creator_name = self.server.client_names[sock]
+    def _on_create_room(self, sock: socket.socket, message: dict) -> None:
+        if sock not in self.server.client_names:
+            self.server.send_message(sock, {"t": "e", "msg": "Please set your name first"})
 
-            if self.server.lobby.player_room_created.get(creator_name, False):
-                self.server.send_message(sock, {"t": "e", "msg": "You can only create one room"})
+            return
 
-                return
+        creator_name = self.server.client_names[sock]
 
-            room_name = message.get("room_name", "").strip()
+        if self.server.lobby.player_room_created.get(creator_name, False):
+            self.server.send_message(sock, {"t": "e", "msg": "You can only create one room"})
 
-            if not (3 <= len(room_name) <= 30):
-                self.server.send_message(sock, {"t": "e", "msg": "Room name must be 3-30 characters long"})
+            return
 
-                return
+        room_name = message.get("room_name", "").strip()
 
-            # Read and validate requested max players (default to server constant)
+        if not (3 <= len(room_name) <= 30):
+            self.server.send_message(sock, {"t": "e", "msg": "Room name must be 3-30 characters long"})
 
-            try:
+            return
 
-                max_players = int(message.get("max_players", MAX_PLAYERS_PER_ROOM))
+        # Read and validate requested max players (default to server constant)
 
-            except (ValueError, TypeError):
+        try:
 
-                max_players = MAX_PLAYERS_PER_ROOM
+            max_players = int(message.get("max_players", MAX_PLAYERS_PER_ROOM))
 
-            if not (2 <= max_players <= MAX_PLAYERS_PER_ROOM):
-                self.server.send_message(sock,
-                                         {"t": "e", "msg": f"max_players must be between 2 and {MAX_PLAYERS_PER_ROOM}"})
+        except (ValueError, TypeError):
 
-                return
+            max_players = MAX_PLAYERS_PER_ROOM
 
-            room_id = self.rooms.create_room(sock, room_name, creator_name, max_players)
+        if not (2 <= max_players <= MAX_PLAYERS_PER_ROOM):
+            self.server.send_message(sock,
+                                     {"t": "e", "msg": f"max_players must be between 2 and {MAX_PLAYERS_PER_ROOM}"})
 
-            if room_id:
+            return
 
-                self.server.lobby.remove_client(sock)
+        room_id = self.rooms.create_room(sock, room_name, creator_name, max_players)
 
-                self.server.lobby.player_room_created[creator_name] = True
+        if room_id:
 
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Room '{room_name}' ({max_players} players) created by {creator_name}")
+            self.server.lobby.remove_client(sock)
 
-                self.server.send_message(sock, {
+            self.server.lobby.player_room_created[creator_name] = True
 
-                    "t": "room_joined",
+            logger.info(f"Room '{room_name}' ({max_players} players) created by {creator_name}")
 
-                    "room_id": room_id,
+            self.server.send_message(sock, {
 
-                    "room_name": room_name,
+                "t": "room_joined",
 
-                    "player_slot": 0,
+                "room_id": room_id,
 
-                    "max_players": max_players
+                "room_name": room_name,
 
-                })
+                "player_slot": 0,
 
-                self.lobby.broadcast({"t": "room_list_update", "rooms": self.rooms.get_available_rooms_info()}, sock,
-                                     self.server)
+                "max_players": max_players
 
-            else:
+            })
 
-                self.server.send_message(sock, {"t": "e",
-                                                "msg": f"Failed to create room (max {MAX_ROOMS} rooms or invalid parameters)"})
+            self.lobby.broadcast_frames(self.rooms.room_list_update_frame, sock, self.server)
 
+        else:
 
-        elif msg_type == "join_room":
+            self.server.send_message(sock, {"t": "e",
+                                            "msg": f"Failed to create room (max {MAX_ROOMS} rooms or invalid parameters)"})
 
-            if sock not in self.server.client_names:
-                self.server.send_message(sock, {"t": "e", "msg": "Please set your name first"})
+    def _on_join_room(self, sock: socket.socket, message: dict) -> None:
+        if sock not in self.server.client_names:
+            self.server.send_message(sock, {"t": "e", "msg": "Please set your name first"})
 
-                return
+            return
 
-            room_id = message.get("room_id")
+        room_id = message.get("room_id")
 
-            slot = self.rooms.join_room(sock, room_id, self.server.client_names[sock])
+        slot = self.rooms.join_room(sock, room_id, self.server.client_names[sock])
 
-            if slot is not None:
+        if slot is not None:
 
-                self.server.lobby.remove_client(sock)
+            self.server.lobby.remove_client(sock)
 
-                player_name = self.server.client_names[sock]
+            player_name = self.server.client_names[sock]
 
-                room = self.rooms.rooms[room_id]
+            room = self.rooms.rooms[room_id]
 
-                players_count = len([p for p in room.players if p])
+            players_count = room.active_count
 
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {player_name} joined room '{room.room_name}' as Player {slot + 1}")
+            logger.info(f"{player_name} joined room '{room.room_name}' as Player {slot + 1}")
 
-                self.server.send_message(sock, {
+            self.server.send_message(sock, {
 
-                    "t": "room_joined",
+                "t": "room_joined",
 
-                    "room_id": room_id,
+                "room_id": room_id,
 
-                    "room_name": room.room_name,
+                "room_name": room.room_name,
 
-                    "player_slot": slot,
+                "player_slot": slot,
 
-                    "max_players": room.max_players
+                "max_players": room.max_players
 
-                })
+            })
 
-                self.rooms.broadcast_to_room(room_id, {
+            self.rooms.broadcast_to_room(room_id, {
 
-                    "t": "player_joined",
+                "t": "player_joined",
 
-                    "player_name": player_name,
+                "player_name": player_name,
 
-                    "player_slot": slot,
+                "player_slot": slot,
 
-                    "players_count": players_count
+                "players_count": players_count
 
-                }, exclude_sock=None, server=self.server)
+            }, exclude_sock=None, server=self.server)
 
-                if room.can_start_game():
+            if room.can_start_game():
 
-                    room.start_game()
+                room.start_game()
 
-                    self._broadcast_game_state(room_id)
+                self.rooms.invalidate_room_list()
 
-                else:
+                self._broadcast_game_state(room_id)
 
-                    players_needed = room.max_players - players_count
+            else:
 
-                    self.rooms.broadcast_to_room(room_id, {
+                players_needed = room.max_players - players_count
 
-                        "t": "waiting",
+                self.rooms.broadcast_to_room(room_id, {
 
-                        "players_needed": players_needed
+                    "t": "waiting",
 
-                    }, exclude_sock=None, server=self.server)
+                    "players_needed": players_needed
 
-                self.lobby.broadcast({"t": "room_list_update", "rooms": self.rooms.get_available_rooms_info()},
+                }, exclude_sock=None, server=self.server)
 
-                                     server=self.server)
+            self.lobby.broadcast_frames(self.rooms.room_list_update_frame, server=self.server)
 
-            else:
+        else:
 
-                self.server.send_message(sock, {"t": "e", "msg": "Failed to join room"})
+            self.server.send_message(sock, {"t": "e", "msg": "Failed to join room"})
 
-        elif msg_type == "refresh_rooms":
-            self.lobby.send_room_list(sock, self.rooms.rooms, self.server)
+    def _on_refresh_rooms(self, sock: socket.socket, message: dict) -> None:
+        self.lobby.send_room_list(sock, self.rooms, self.server)
 
     def handle_room_message(self, sock: socket.socket, message: dict) -> None:
         room_id = self.rooms.client_rooms.get(sock)
@@ -469,43 +635,57 @@ class MessageHandler:
             return
 
         room = self.rooms.rooms[room_id]
-        msg_type = message.get("t")
+        handler = self._room_handlers.get(message.get("t"), self._on_invalid_room_action)
+        handler(sock, message, room_id, room)
 
-        if msg_type == "leave_room":
-            self.rooms.leave_room(sock, self.server, self.lobby)
+    def _player_on_turn(self, sock: socket.socket, room: GameRoom) -> Optional[int]:
+        """Slot of sock if a game is running and it is that player's turn; otherwise None, after replying with an error."""
+        if not room.game:
+            return None
+        player_slot = room.sock_to_slot.get(sock, -1)
+        if player_slot != room.game.current_player:
+            self.server.send_message(sock, {"t": "e", "msg": "Invalid action or not your turn"})
+            return None
+        return player_slot
 
-        elif room.game:
-            player_slot = next((p.slot for p in room.players if p and p.sock == sock), -1)
+    def _on_leave_room(self, sock: socket.socket, message: dict, room_id: str, room: GameRoom) -> None:
+        self.rooms.leave_room(sock, self.server, self.lobby)
 
-            if msg_type == "p" and player_slot == room.game.current_player:
-                card_index = message.get("ci", -1)
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_slot + 1} attempting to play card {card_index} in room '{room.room_name}'")
+    def _on_play_card(self, sock: socket.socket, message: dict, room_id: str, room: GameRoom) -> None:
+        player_slot = self._player_on_turn(sock, room)
+        if player_slot is None:
+            return
+        card_index = message.get("ci", -1)
+        logger.debug("Player %d attempting to play card %s in room '%s'", player_slot + 1, card_index, room.room_name)
 
-                if room.game.play_card(player_slot, card_index):
-                    print(
-                        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_slot + 1} played card successfully in room '{room.room_name}'")
+        if room.game.play_card(player_slot, card_index):
+            logger.debug("Player %d played card successfully in room '%s'", player_slot + 1, room.room_name)
 
-                    if not room.game.players[player_slot] and player_slot not in room.finish_order:
-                        room.finish_order.append(player_slot)
-                        print(
-                            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_slot + 1} finished in room '{room.room_name}'")
+            if not room.game.players[player_slot] and player_slot not in room.finish_order:
+                room.finish_order.append(player_slot)
+                logger.debug("Player %d finished in room '%s'", player_slot + 1, room.room_name)
 
-                    self._broadcast_game_state(room_id)
-                else:
-                    self.server.send_message(sock, {"t": "e", "msg": "Invalid card play"})
+            self.rooms.dirty.add(room_id)
+            self._broadcast_game_state(room_id)
+        else:
+            self.server.send_message(sock, {"t": "e", "msg": "Invalid card play"})
 
-            elif msg_type == "d" and player_slot == room.game.current_player:
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Player {player_slot + 1} drawing card in room '{room.room_name}'")
+    def _on_draw_card(self, sock: socket.socket, message: dict, room_id: str, room: GameRoom) -> None:
+        player_slot = self._player_on_turn(sock, room)
+        if player_slot is None:
+            return
+        logger.debug("Player %d drawing card in room '%s'", player_slot + 1, room.room_name)
 
-                if room.game.draw_card(player_slot):
-                    room.game.next_turn()
-                    self._broadcast_game_state(room_id)
-                else:
-                    self.server.send_message(sock, {"t": "e", "msg": "Cannot draw card: draw pile empty"})
-            else:
-                self.server.send_message(sock, {"t": "e", "msg": "Invalid action or not your turn"})
+        if room.game.draw_card(player_slot):
+            room.game.next_turn()
+            self.rooms.dirty.add(room_id)
+            self._broadcast_game_state(room_id)
+        else:
+            self.server.send_message(sock, {"t": "e", "msg": "Cannot draw card: draw pile empty"})
+
+    def _on_invalid_room_action(self, sock: socket.socket, message: dict, room_id: str, room: GameRoom) -> None:
+        if room.game:
+            self.server.send_message(sock, {"t": "e", "msg": "Invalid action or not your turn"})
 
     def _broadcast_game_state(self, room_id: str) -> None:
         room = self.rooms.rooms[room_id]
@@ -514,17 +694,24 @@ class MessageHandler:
 
         current_state = room.game.serialize()
         current_state["player_names"] = room.player_names
-        print("[SERVER DEBUG GS] Broadcasting to room '{room.room_name}': player_names =", room.player_names)
-        print("[SERVER DEBUG GS] Full current_state keys:", list(current_state.keys()))
+        logger.debug("Broadcasting game state to room '%s': player_names = %s", room.room_name, room.player_names)
         room.last_game_state = current_state
         self.rooms.broadcast_to_room(room_id, {"t": "gs", **current_state}, server=self.server)
 
 
 class MultiRoomServer:
-    def __init__(self, port: int):
+    def __init__(self, port: int, reuse_port: bool = False):
+        # DefaultSelector is epoll on Linux and falls back to select() on Windows, where run_server.bat is used.
         self.sel = selectors.DefaultSelector()
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            # Lets several server processes share the port with the kernel spreading accepts between them.
+            # Rooms and the lobby live in each process, so players only meet others on the same instance.
+            if hasattr(socket, "SO_REUSEPORT"):
+                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            else:
+                logger.error("SO_REUSEPORT is not supported on this platform; ignoring --reuse-port")
 
         try:
             self.server_socket.bind((HOST, port))
@@ -540,14 +727,17 @@ class MultiRoomServer:
         self.rooms = RoomManager()
         self.message_handler = MessageHandler(self.lobby, self.rooms, self)
         self.client_names: Dict[socket.socket, str] = {}
+        self.client_caps: Dict[socket.socket, int] = {}  # Frame flags each client advertised in set_name
+        self.tx_buffers: Dict[socket.socket, bytearray] = {}  # Framed bytes queued per client, flushed once per loop pass
+        self.rx_buffers: Dict[socket.socket, bytearray] = {}  # Reused receive buffer per client, filled by recv_into
+        self.rx_lengths: Dict[socket.socket, int] = {}  # Bytes of each rx buffer not yet parsed into whole frames
 
         signal.signal(signal.SIGINT, self._signal_handler)
         local_ip = get_local_ip()
-        print(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Multi-room server started on {local_ip}:{port} and localhost:{port}")
+        logger.info(f"Multi-room server started on {local_ip}:{port} and localhost:{port}")
 
     def _signal_handler(self, sig, frame):
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Shutting down multi-room server...")
+        logger.info("Shutting down multi-room server...")
         for room in self.rooms.rooms.values():
             for sock in room.sockets:
                 try:
@@ -563,65 +753,148 @@ class MultiRoomServer:
         self.sel.close()
         sys.exit(0)
 
-    def send_message(self, sock: socket.socket, message: dict, retries: int = 2) -> bool:
-        try:
-            data = zlib.compress(json.dumps(message, separators=(',', ':')).encode())
-            sock.sendall(struct.pack('!I', len(data)) + data)
-            return True
-        except socket.error as e:
+    def _tx_buffer(self, sock: socket.socket) -> bytearray:
+        buf = self.tx_buffers.get(sock)
+        if buf is None:
+            buf = self.tx_buffers[sock] = bytearray()
+        return buf
+
+    def send_message(self, sock: socket.socket, message: dict) -> bool:
+        if sock.fileno() == -1:
+            return False
+        flags, data = encode_payload(message, self.client_caps.get(sock, 0))
+        # Reserve the header in place and fill it in after the payload, so no header+payload copy is built.
+        buf = self._tx_buffer(sock)
+        offset = len(buf)
+        buf += FRAME_HEADER_PLACEHOLDER
+        buf += data
+        FRAME_HEADER.pack_into(buf, offset, len(data), flags)
+        return True
+
+    def send_raw(self, sock: socket.socket, framed: bytes) -> bool:
+        """Queue an already encoded frame; broadcasts encode once per caps and share the bytes between sockets."""
+        if sock.fileno() == -1:
+            return False
+        self._tx_buffer(sock).extend(framed)
+        return True
+
+    def _flush(self, sock: socket.socket) -> bool:
+        """Write as much of sock's queue as the kernel takes; watch for writability while anything is left."""
+        buf = self.tx_buffers.get(sock)
+        while buf:
+            try:
+                sent = sock.send(buf)
+            except BlockingIOError:
+                break
+            except socket.error as e:
+                client_name = self.client_names.get(sock, 'unknown')
+                logger.error(f"Send error to {client_name}: {e}")
+                return False
+            del buf[:sent]
+        if buf and len(buf) > MAX_TX_BACKLOG:
             client_name = self.client_names.get(sock, 'unknown')
-            logger.error(f"Send error to {client_name}: {e}")
-            if retries > 0:
-                time.sleep(0.1)
-                return self.send_message(sock, message, retries - 1)
+            logger.error(f"Dropping {client_name}: {len(buf)} bytes of output not being read")
             return False
+        events = selectors.EVENT_READ | selectors.EVENT_WRITE if buf else selectors.EVENT_READ
+        try:
+            if self.sel.get_key(sock).events != events:
+                self.sel.modify(sock, events, self._handle_client)
+        except KeyError:
+            pass
+        return True
 
-    def receive_message(self, sock: socket.socket) -> Optional[dict]:
+    def _flush_all(self) -> List[socket.socket]:
+        """Flush every pending queue; returns the sockets that failed, for the caller to remove."""
+        return [sock for sock, buf in list(self.tx_buffers.items()) if buf and not self._flush(sock)]
+
+    def receive_messages(self, sock: socket.socket) -> Optional[List[dict]]:
+        """Drain what the socket has and decode every complete frame; None means the client is gone."""
+        rx = self.rx_buffers.get(sock)
+        if rx is None:
+            rx = self.rx_buffers[sock] = bytearray(RECV_BUFFER_SIZE)
+        rx_len = self.rx_lengths.get(sock, 0)
+        if rx_len == len(rx):
+            # A frame larger than the buffer is still arriving; grow instead of passing recv_into an empty view.
+            rx.extend(bytes(len(rx)))
+        try:
+            with memoryview(rx)[rx_len:] as free:
+                received = sock.recv_into(free)
+        except BlockingIOError:
+            return []
+        except socket.error as e:
+            logger.error(f"Receive error: {e}")
+            return None
+        if not received:
+            return None
+        rx_len += received
+        messages = []
+        header_size = FRAME_HEADER.size
+        pos = 0
         try:
-            length_data = sock.recv(4)
-            if not length_data:
-                return None
-            length = struct.unpack('!I', length_data)[0]
-            data = b""
-            while len(data) < length:
-                packet = sock.recv(length - len(data))
-                if not packet:
-                    return None
-                data += packet
-            message = json.loads(zlib.decompress(data).decode())
-            return message
-        except (socket.error, json.JSONDecodeError, struct.error, zlib.error) as e:
+            while rx_len - pos >= header_size:
+                length, flags = FRAME_HEADER.unpack_from(rx, pos)
+                end = pos + header_size + length
+                if rx_len < end:
+                    break
+                with memoryview(rx)[pos + header_size:end] as payload:
+                    messages.append(decode_frame(flags, payload.tobytes()))
+                pos = end
+        except (ValueError, struct.error, zlib.error) as e:
             logger.error(f"Receive error: {e}")
             return None
+        if pos:
+            # Move the unfinished tail to the front, then give back any room a one-off large frame needed.
+            rx[:rx_len - pos] = rx[pos:rx_len]
+            rx_len -= pos
+            if len(rx) > RECV_BUFFER_SIZE and rx_len <= RECV_BUFFER_SIZE:
+                del rx[RECV_BUFFER_SIZE:]
+        self.rx_lengths[sock] = rx_len
+        return messages
 
     def start(self) -> None:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server ready for connections")
+        logger.info("Server ready for connections")
         while True:
-            events = self.sel.select(timeout=0.1)
+            events = self.sel.select(timeout=IDLE_SELECT_TIMEOUT)
             for key, mask in events:
                 callback = key.data
                 callback(key.fileobj, mask)
 
-            for room_id in list(self.rooms.rooms.keys()):
-                room = self.rooms.rooms[room_id]
-                if room.game:
-                    current_player = room.game.current_player
-                    if len(room.game.players[current_player]) == 0 and not room.game.check_game_over():
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Auto-skipping turn for disconnected Player {current_player + 1} in room '{room.room_name}'")
-                        room.game.next_turn()
-                        self.message_handler._broadcast_game_state(room_id)
+            while True:
+                self._housekeep_rooms()
+                # Everything queued during this pass goes out together, one send per client.
+                failed = self._flush_all()
+                if not failed:
+                    break
+                # Dropping a client queues frames for others and dirties its room, so go round again.
+                for sock in failed:
+                    self._remove_client(sock)
+
+    def _housekeep_rooms(self) -> None:
+        # Only rooms touched during this pass can need a turn skipped, a game ended or the room closed.
+        dirty = self.rooms.dirty
+        while dirty:
+            room_id = dirty.pop()
+            room = self.rooms.rooms.get(room_id)
+            if room and room.game:
+                current_player = room.game.current_player
+                if len(room.game.players[current_player]) == 0 and not room.game.check_game_over():
+                    logger.info(f"Auto-skipping turn for disconnected Player {current_player + 1} in room '{room.room_name}'")
+                    room.game.next_turn()
+                    self.message_handler._broadcast_game_state(room_id)
 
-                    if room.game.check_game_over():
-                        self.rooms.end_game(room_id, self, self.lobby)
+                if room.game.check_game_over():
+                    self.rooms.end_game(room_id, self, self.lobby)
 
-                    if room.is_empty():
-                        print(
-                            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing empty room: {room.room_name}")
-                        del self.rooms.rooms[room_id]
+                if room.is_empty():
+                    logger.info(f"Removing empty room: {room.room_name}")
+                    del self.rooms.rooms[room_id]
+                    self.rooms.invalidate_room_list()
 
     def _accept_client(self, sock: socket.socket, mask: int) -> None:
         try:
             client_sock, addr = sock.accept()
+            # Frames are already coalesced per loop pass in tx_buffers, so Nagle would only add delay.
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             client_sock.setblocking(False)
             self.sel.register(client_sock, selectors.EVENT_READ, self._handle_client)
 
@@ -630,10 +903,11 @@ class MultiRoomServer:
 
             self.lobby.add_client(client_sock)
 
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] New client connected from {client_display}")
+            logger.info(f"New client connected from {client_display}")
 
             self.send_message(client_sock, {
                 "t": "lobby_welcome",
+                "caps": LOCAL_CAPS,
                 "msg": "Welcome! Enter your name to continue."
             })
 
@@ -641,19 +915,27 @@ class MultiRoomServer:
             logger.error(f"Accept error: {e}")
 
     def _handle_client(self, sock: socket.socket, mask: int) -> None:
-        message = self.receive_message(sock)
-        if message is None:
+        if mask & selectors.EVENT_WRITE:
+            if not self._flush(sock):
+                self._remove_client(sock)
+                return
+            if not mask & selectors.EVENT_READ:
+                return
+
+        messages = self.receive_messages(sock)
+        if messages is None:
             self._remove_client(sock)
             return
 
-        try:
-            if sock in self.lobby.clients:
-                self.message_handler.handle_lobby_message(sock, message)
-            elif sock in self.rooms.client_rooms:
-                self.message_handler.handle_room_message(sock, message)
-        except Exception as e:
-            logger.error(f"Error handling client message: {e}")
-            self.send_message(sock, {"t": "e", "msg": f"Server error: {str(e)}"})
+        for message in messages:
+            try:
+                if sock in self.lobby.clients:
+                    self.message_handler.handle_lobby_message(sock, message)
+                elif sock in self.rooms.client_rooms:
+                    self.message_handler.handle_room_message(sock, message)
+            except Exception as e:
+                logger.error(f"Error handling client message: {e}")
+                self.send_message(sock, {"t": "e", "msg": f"Server error: {str(e)}"})
 
     def _remove_client(self, sock: socket.socket) -> None:
         client_name = self.client_names.get(sock, "Unknown")
@@ -664,27 +946,32 @@ class MultiRoomServer:
         except:
             client_display = "unknown"
 
-        print(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Client {client_name} disconnected from {client_display}")
+        logger.info(f"Client {client_name} disconnected from {client_display}")
 
         if sock in self.rooms.client_rooms:
             self.rooms.leave_room(sock, self, self.lobby)
 
         self.lobby.remove_client(sock)
         self.client_names.pop(sock, None)
+        self.client_caps.pop(sock, None)
+        self.tx_buffers.pop(sock, None)
+        self.rx_buffers.pop(sock, None)
+        self.rx_lengths.pop(sock, None)
         try:
-            sock.close()
             self.sel.unregister(sock)
-        except:
+        except (KeyError, ValueError):
             pass
+        sock.close()
 
-        self.lobby.broadcast({"t": "room_list_update", "rooms": self.rooms.get_available_rooms_info()}, server=self)
+        self.lobby.broadcast_frames(self.rooms.room_list_update_frame, server=self)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Multi-room Sedma bere tri server")
     parser.add_argument("--port", type=int, default=int(os.getenv("PORT", DEFAULT_PORT)), help="Port to listen on")
+    parser.add_argument("--reuse-port", action="store_true",
+                        help="Set SO_REUSEPORT so more server processes can listen on the same port")
     args = parser.parse_args()
 
-    server = MultiRoomServer(args.port)
+    server = MultiRoomServer(args.port, args.reuse_port)
     server.start()
\ No newline at end of file